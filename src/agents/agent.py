@@ -1,22 +1,108 @@
 """Agents for agents-meeting."""
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import AsyncGenerator
+from itertools import chain, islice
+from typing import Any, AsyncGenerator, Callable, Sequence
 
 from src.config import AgentConfig, APIKeysConfig
-from src.providers import (
-    LLMProvider,
-    Message,
-    OpenAIProvider,
-    AnthropicProvider,
-    OllamaProvider,
-    CustomProvider,
-    GeminiProvider,
-    LMStudioProvider,
-)
+from src.providers import LLMProvider, Message, ROLE_ASSISTANT, ROLE_USER
 
 
-@dataclass
+# Each factory imports its provider on first use so only the SDKs of
+# configured providers are ever loaded (src.providers is lazy too).
+def _build_openai(config: AgentConfig, api_key: str | None, extra: dict[str, Any]) -> LLMProvider:
+    from src.providers import OpenAIProvider
+
+    return OpenAIProvider(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        api_key=api_key,
+        base_url=config.base_url,
+        **extra,
+    )
+
+
+def _build_anthropic(
+    config: AgentConfig, api_key: str | None, extra: dict[str, Any]
+) -> LLMProvider:
+    from src.providers import AnthropicProvider
+
+    return AnthropicProvider(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        api_key=api_key,
+        base_url=config.base_url,
+        cache_system=True,
+        **extra,
+    )
+
+
+def _build_ollama(config: AgentConfig, api_key: str | None, extra: dict[str, Any]) -> LLMProvider:
+    from src.providers import OllamaProvider
+
+    return OllamaProvider(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        base_url=config.base_url or "http://localhost:11434",
+        **extra,
+    )
+
+
+def _build_custom(config: AgentConfig, api_key: str | None, extra: dict[str, Any]) -> LLMProvider:
+    from src.providers import CustomProvider
+
+    return CustomProvider(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        base_url=config.base_url or "http://localhost:8000/v1",
+        api_key=api_key,
+        **extra,
+    )
+
+
+def _build_gemini(config: AgentConfig, api_key: str | None, extra: dict[str, Any]) -> LLMProvider:
+    from src.providers import GeminiProvider
+
+    return GeminiProvider(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        api_key=api_key,
+        **extra,
+    )
+
+
+def _build_lmstudio(
+    config: AgentConfig, api_key: str | None, extra: dict[str, Any]
+) -> LLMProvider:
+    from src.providers import LMStudioProvider
+
+    return LMStudioProvider(
+        model=config.model,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+        base_url=config.base_url or "http://localhost:1234",
+        api_key=api_key,
+        **extra,
+    )
+
+
+_PROVIDER_FACTORIES: dict[str, Callable[[AgentConfig, str | None, dict[str, Any]], LLMProvider]] = {
+    "openai": _build_openai,
+    "anthropic": _build_anthropic,
+    "ollama": _build_ollama,
+    "custom": _build_custom,
+    "gemini": _build_gemini,
+    "lmstudio": _build_lmstudio,
+}
+
+
+@dataclass(slots=True)
 class Turn:
     """A turn of speech for an agent."""
 
@@ -26,6 +112,12 @@ class Turn:
     timestamp: float = 0.0
 
 
+# Upper bound on retained history messages and turns per agent. Generous for
+# any realistic debate; caps memory growth in long add_round / continue_with
+# sessions, with O(1) left-eviction once full.
+HISTORY_MAXLEN = 256
+
+
 @dataclass
 class Agent:
     """Represents an agent in the debate."""
@@ -33,70 +125,39 @@ class Agent:
     config: AgentConfig
     global_api_keys: APIKeysConfig | None = None
     provider: LLMProvider = field(init=False)
-    history: list[Message] = field(default_factory=list)
-    turns: list[Turn] = field(default_factory=list)
+    history: deque[Message] = field(default_factory=lambda: deque(maxlen=HISTORY_MAXLEN))
+    turns: deque[Turn] = field(default_factory=lambda: deque(maxlen=HISTORY_MAXLEN))
+    # Same turns bucketed by phase so consumers filter in O(1) instead of
+    # scanning the full log; kept in sync by record_turn.
+    turns_by_phase: dict[str, list[Turn]] = field(default_factory=lambda: defaultdict(list))
 
     def __post_init__(self) -> None:
         self.provider = self._create_provider()
+        self._system_cache: dict[tuple, str] = {}
 
-    def _create_provider(self) -> LLMProvider:
-        extra = self.config.extra or {}
-        api_key = self.config.resolve_api_key(self.global_api_keys)
+    def record_turn(self, turn: Turn) -> None:
+        """Append a turn to the chronological log and its phase bucket."""
+        if len(self.turns) == self.turns.maxlen:
+            # The deque is about to evict its oldest turn; drop it from its
+            # bucket too so the two views stay consistent.
+            oldest = self.turns[0]
+            bucket = self.turns_by_phase.get(oldest.phase)
+            if bucket and bucket[0] is oldest:
+                del bucket[0]
+        self.turns.append(turn)
+        self.turns_by_phase[turn.phase].append(turn)
 
-        if self.config.provider == "openai":
-            return OpenAIProvider(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=api_key,
-                base_url=self.config.base_url,
-                **extra,
-            )
-        elif self.config.provider == "anthropic":
-            return AnthropicProvider(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=api_key,
-                base_url=self.config.base_url,
-                **extra,
-            )
-        elif self.config.provider == "ollama":
-            return OllamaProvider(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                base_url=self.config.base_url or "http://localhost:11434",
-                **extra,
-            )
-        elif self.config.provider == "custom":
-            return CustomProvider(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                base_url=self.config.base_url or "http://localhost:8000/v1",
-                api_key=api_key,
-                **extra,
-            )
-        elif self.config.provider == "gemini":
-            return GeminiProvider(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=api_key,
-                **extra,
-            )
-        elif self.config.provider == "lmstudio":
-            return LMStudioProvider(
-                model=self.config.model,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                base_url=self.config.base_url or "http://localhost:1234",
-                api_key=api_key,
-                **extra,
-            )
-        else:
+    def clear_turns(self) -> None:
+        """Drop all recorded turns (both views)."""
+        self.turns.clear()
+        self.turns_by_phase.clear()
+
+    def _create_provider(self) -> LLMProvider:
+        factory = _PROVIDER_FACTORIES.get(self.config.provider)
+        if factory is None:
             raise ValueError(f"Unknown provider: {self.config.provider}")
+        api_key = self.config.resolve_api_key(self.global_api_keys)
+        return factory(self.config, api_key, self.config.extra or {})
 
     def build_system_prompt(
         self,
@@ -104,7 +165,16 @@ class Agent:
         leader_prompt: str | None = None,
         identity_template: str | None = None,
     ) -> str:
-        """Build the system prompt for the agent."""
+        """Build the system prompt for the agent.
+
+        The inputs are static for the duration of a debate, so the result is
+        memoized; the cache holds at most a couple of entries per agent.
+        """
+        key = (global_system, leader_prompt, identity_template)
+        cached = self._system_cache.get(key)
+        if cached is not None:
+            return cached
+
         parts = []
         if global_system:
             parts.append(global_system)
@@ -112,7 +182,9 @@ class Agent:
         parts.append(template.format(name=self.config.name, role=self.config.role))
         if leader_prompt:
             parts.append(leader_prompt)
-        return "\n\n".join(parts)
+        result = "\n\n".join(parts)
+        self._system_cache[key] = result
+        return result
 
     async def think(
         self,
@@ -122,8 +194,14 @@ class Agent:
         leader_prompt: str | None = None,
         identity_template: str | None = None,
         context_template: str | None = None,
+        context_messages: Sequence[Message] | None = None,
     ) -> str:
-        """The agent thinks and responds to the prompt."""
+        """The agent thinks and responds to the prompt.
+
+        ``context_messages`` are inserted between the history and the user
+        prompt and persisted to the history afterwards, so per-round context
+        can vary without altering the bytes of the user prompt itself.
+        """
         system = self.build_system_prompt(system_prompt, leader_prompt, identity_template)
 
         user_content = prompt
@@ -131,15 +209,17 @@ class Agent:
             tmpl = context_template or "Other agents' context:\n{context}\n\nQuestion: {prompt}"
             user_content = tmpl.format(context=context, prompt=prompt)
 
-        messages = list(self.history) + [Message(role="user", content=user_content)]
+        user_message = Message(role=ROLE_USER, content=user_content)
 
         response = await self.provider.chat(
-            messages=messages,
+            messages=chain(self.history, context_messages or (), (user_message,)),
             system_prompt=system,
         )
 
-        self.history.append(Message(role="user", content=user_content))
-        self.history.append(Message(role="assistant", content=response.content))
+        self.history.extend(context_messages or ())
+        self.history.append(user_message)
+        self.history.append(Message(role=ROLE_ASSISTANT, content=response.content))
+        await self._maybe_summarize()
 
         return response.content
 
@@ -151,6 +231,7 @@ class Agent:
         leader_prompt: str | None = None,
         identity_template: str | None = None,
         context_template: str | None = None,
+        context_messages: Sequence[Message] | None = None,
     ) -> AsyncGenerator[str, None]:
         """Streaming version of think."""
         system = self.build_system_prompt(system_prompt, leader_prompt, identity_template)
@@ -160,18 +241,63 @@ class Agent:
             tmpl = context_template or "Other agents' context:\n{context}\n\nQuestion: {prompt}"
             user_content = tmpl.format(context=context, prompt=prompt)
 
-        messages = list(self.history) + [Message(role="user", content=user_content)]
+        user_message = Message(role=ROLE_USER, content=user_content)
 
-        full_content = ""
+        parts: list[str] = []
         async for chunk in self.provider.chat_stream(
-            messages=messages,
+            messages=chain(self.history, context_messages or (), (user_message,)),
             system_prompt=system,
         ):
-            full_content += chunk
+            parts.append(chunk)
             yield chunk
 
-        self.history.append(Message(role="user", content=user_content))
-        self.history.append(Message(role="assistant", content=full_content))
+        self.history.extend(context_messages or ())
+        self.history.append(user_message)
+        self.history.append(Message(role=ROLE_ASSISTANT, content="".join(parts)))
+        await self._maybe_summarize()
+
+    def _estimate_history_tokens(self) -> int:
+        """Cheap token estimate for the history (~4 characters per token)."""
+        return sum(len(m.content) for m in self.history) // 4
+
+    async def _maybe_summarize(self) -> None:
+        """Compress older history turns once the token budget is exceeded.
+
+        Keeps the first message (the topic) and the last user/assistant pair
+        intact; everything in between is replaced by a single summary message
+        produced by the agent's own provider. Without this, an agent that
+        speaks every round pays input tokens proportional to the sum of all
+        previous rounds.
+        """
+        budget = self.config.history_token_budget
+        if not budget or len(self.history) <= 4:
+            return
+        if self._estimate_history_tokens() <= budget:
+            return
+
+        middle = list(islice(self.history, 1, len(self.history) - 2))
+        if not middle:
+            return
+        transcript = "\n\n".join(f"{m.role}: {m.content}" for m in middle)
+        try:
+            response = await self.provider.chat(
+                messages=[Message(role=ROLE_USER, content=transcript)],
+                system_prompt=(
+                    "Summarize the following conversation turns as concisely as "
+                    "possible while keeping every position, decision and open "
+                    "question. Respond only with the summary."
+                ),
+            )
+        except Exception:
+            return
+        summary = Message(
+            role=ROLE_ASSISTANT,
+            content=f"[Summary of earlier turns]\n{response.content}",
+        )
+        head = self.history[0]
+        tail = [self.history[-2], self.history[-1]]
+        self.history.clear()
+        self.history.extend([head, summary, *tail])
 
     async def react(
         self,
@@ -180,12 +306,11 @@ class Agent:
         system_prompt: str | None = None,
     ) -> str:
         """The agent reacts to other agents' responses."""
-        context_lines = [f"### Response from {name}:" for name in other_agents_responses.keys()]
-        context_lines.append("")
-        for name, response in other_agents_responses.items():
-            context_lines.append(f"**{name}**: {response}")
-
-        context = "\n".join(context_lines)
+        context = "\n".join(
+            line
+            for name, response in other_agents_responses.items()
+            for line in (f"### Response from {name}:", f"**{name}**: {response}")
+        )
         return await self.think(prompt, context=context, system_prompt=system_prompt)
 
     async def close(self) -> None:
@@ -1,15 +1,29 @@
 """Multi-agent debate system with leader."""
 
 import asyncio
+import gzip
+import io
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable
 
 from src.agents.agent import Agent, Turn
 from src.config import DebateConfig, MeetingConfig
+from src.providers import Message, ROLE_ASSISTANT, ROLE_USER
 
 
-@dataclass
+# Markdown export templates. Hoisted so the hot per-turn loops in
+# _build_markdown reuse one pre-parsed format string instead of
+# rebuilding an f-string each iteration.
+_MD_HEADER = "# {title}\n\n> {prompt}\n\n---\n\n"
+_MD_LEADER_HEADER = "## {name} ({provider} / {model})\n\n"
+_MD_LEADER_SECTION = "### {label}\n\n{content}\n\n"
+_MD_AGENT_HEADER = "### {name} ({provider} / {model})\n"
+_MD_AGENT_TURN = "**Round {round}**\n\n{content}\n\n"
+
+
+@dataclass(slots=True)
 class DebateEvent:
     """Event in the debate."""
     type: str
@@ -24,6 +38,11 @@ class DebateEvent:
 class DebateManager:
     """Manages the debate flow between agents."""
 
+    # Streaming events are coalesced: chunks are buffered and emitted once the
+    # buffer reaches this many characters or this much time has elapsed.
+    STREAM_FLUSH_CHARS = 64
+    STREAM_FLUSH_SECS = 0.02
+
     def __init__(
         self,
         config: MeetingConfig,
@@ -32,39 +51,69 @@ class DebateManager:
         self.config = config
         self.agents: list[Agent] = []
         self.leader: Agent | None = None
-        self.events: list[DebateEvent] = []
+        # Computed once in initialize(); agents never change mid-debate.
+        self._non_leaders: list[Agent] = []
+        # Streaming chunk events are never stored (see _emit); the bound is a
+        # safety net for very long add_round / continue_with sessions.
+        self.events: deque[DebateEvent] = deque(maxlen=10_000)
         self.on_event = on_event
         self._current_round = 0
         self._current_phase = ""
         self._leader_last_content: str = ""
-        self._cancelled: bool = False
+        self._moderator_context_prefix: str = ""
+        self._last_round_responses: dict[str, str] = {}
+        self._last_conclusion: Turn | None = None
+        self._leader_system_prompt: str | None = None
+        self._cancel_event = asyncio.Event()
+        # Replaced in initialize() once the agent count is known
+        self._sem: asyncio.Semaphore = asyncio.Semaphore(1)
 
     def cancel(self) -> None:
         """Request to stop the debate."""
-        self._cancelled = True
+        self._cancel_event.set()
 
     @property
     def is_cancelled(self) -> bool:
-        return self._cancelled
+        return self._cancel_event.is_set()
 
     async def initialize(self) -> None:
         """Initialize the agents."""
-        for agent_config in self.config.agents:
-            agent = Agent(config=agent_config, global_api_keys=self.config.api_keys)
-            if agent_config.is_leader:
+        async def _build_agent(agent_config) -> Agent:
+            return Agent(config=agent_config, global_api_keys=self.config.api_keys)
+
+        # gather preserves argument order, so self.agents matches the config order
+        self.agents = list(await asyncio.gather(
+            *(_build_agent(agent_config) for agent_config in self.config.agents)
+        ))
+        for agent in self.agents:
+            if agent.config.is_leader:
                 self.leader = agent
-            self.agents.append(agent)
 
         if not self.leader and self.agents:
             self.leader = self.agents[0]
 
-    async def run(self) -> dict[str, list[Turn]]:
+        self._non_leaders = [agent for agent in self.agents if agent is not self.leader]
+
+        # Built once per run; the underlying inputs are static per debate
+        self._leader_system_prompt = (
+            self.leader.build_system_prompt(
+                self.config.debate.system_prompt,
+                identity_template=self.config.debate.agent_identity_template,
+            )
+            if self.leader else None
+        )
+
+        self._sem = asyncio.Semaphore(
+            self.config.debate.max_concurrent_agents or len(self.agents) or 1
+        )
+
+    async def run(self) -> dict[str, deque[Turn]]:
         """Execute the complete debate."""
         self._emit("start", 0, "init", None, None)
 
         # 1. The moderator opens the debate
         await self._phase_intro()
-        if self._cancelled:
+        if self.is_cancelled:
             return {agent.config.name: agent.turns for agent in self.agents}
 
         # 2. Discussion loop
@@ -72,20 +121,24 @@ class DebateManager:
             self._current_round = round_num
             # Agents respond based on the moderator's last intervention
             await self._phase_discussion(round_num)
-            if self._cancelled:
+            if self.is_cancelled:
                 return {agent.config.name: agent.turns for agent in self.agents}
             # The moderator synthesizes (including in the last round, before conclusion)
             await self._leader_intervention(round_num)
-            if self._cancelled:
+            if self.is_cancelled:
                 return {agent.config.name: agent.turns for agent in self.agents}
 
         # 3. Final synthesis
         await self._phase_conclusion()
 
+        # 4. The leader proposes a continuation question. Started before the
+        # end event so its LLM latency overlaps the end-of-debate handling;
+        # the continuation_suggestion event fires whenever the model replies.
+        continuation_task = asyncio.create_task(self._generate_continuation_question())
+
         self._emit("end", 0, "end", None, None)
 
-        # 4. The leader proposes a continuation question
-        await self._generate_continuation_question()
+        await continuation_task
 
         result = {agent.config.name: agent.turns for agent in self.agents}
         return result
@@ -108,7 +161,7 @@ class DebateManager:
         full_content = await self._stream_leader(prompt, 0, "intro")
 
         turn = Turn(round=0, phase="intro", content=full_content)
-        self.leader.turns.append(turn)
+        self.leader.record_turn(turn)
         self._emit("leader_speak", 0, "intro", self.leader.config.name, full_content)
 
         # Store for agents to use in round 1
@@ -119,43 +172,117 @@ class DebateManager:
         self._current_phase = f"discussion_{round_num}"
         self._emit("phase_start", round_num, "discussion", None, None)
 
-        # Common context for all agents: last moderator synthesis/intro
-        moderator_context = (
-            self.config.debate.moderator_context_prefix.format(content=self._leader_last_content)
+        if not self._non_leaders:
+            # Leader-only debate: nothing would run, skip task creation
+            self._last_round_responses = {}
+            return
+
+        # Common context for all agents: last moderator synthesis/intro.
+        # Passed as a standalone message (not folded into the user prompt via
+        # the context template) so the user prompt stays byte-identical from
+        # round to round and provider prefix caches keep hitting.
+        context_messages = (
+            (Message(
+                role=ROLE_USER,
+                content=self.config.debate.moderator_context_prefix.format(
+                    content=self._leader_last_content
+                ),
+            ),)
             if self._leader_last_content else None
         )
 
-        async def get_agent_response(agent: Agent) -> tuple[str, str]:
-            if agent == self.leader:
-                return agent.config.name, ""
+        debate_config = self.config.debate
+        initial_prompt = debate_config.initial_prompt
+        system_prompt = debate_config.system_prompt
+        identity_template = debate_config.agent_identity_template
 
+        async def get_agent_response(agent: Agent) -> tuple[str, str]:
             self._emit("agent_thinking", round_num, "discussion", agent.config.name, None)
 
-            full_content = ""
+            if self.on_event is None:
+                # Nobody consumes streaming events: one non-streaming call
+                # avoids the per-chunk decoding and dispatch entirely.
+                try:
+                    async with self._sem:
+                        full_content = await agent.think(
+                            initial_prompt,
+                            system_prompt=system_prompt,
+                            identity_template=identity_template,
+                            context_messages=context_messages,
+                        )
+                except asyncio.CancelledError:
+                    full_content = ""
+                except Exception as e:
+                    full_content = f"[Error: {e}]"
+
+                turn = Turn(round=round_num, phase="discussion", content=full_content)
+                agent.record_turn(turn)
+                self._emit("agent_speak", round_num, "discussion", agent.config.name, full_content)
+                self._emit_cache_stats(agent, round_num, "discussion")
+                return agent.config.name, full_content
+
+            loop = asyncio.get_running_loop()
+            cancelled = self._cancel_event.is_set
+            parts: list[str] = []
+            buf: list[str] = []
+            buf_len = 0
+            last_flush = loop.time()
+
+            def flush() -> None:
+                nonlocal buf, buf_len, last_flush
+                if buf:
+                    self._emit("agent_streaming", round_num, "discussion",
+                               agent.config.name, "".join(buf), is_streaming=True)
+                    buf = []
+                    buf_len = 0
+                last_flush = loop.time()
+
             try:
-                async for chunk in agent.think_stream(
-                    self.config.debate.initial_prompt,
-                    context=moderator_context,
-                    system_prompt=self.config.debate.system_prompt,
-                    identity_template=self.config.debate.agent_identity_template,
-                    context_template=self.config.debate.agent_context_template,
-                ):
-                    if self._cancelled:
-                        break
-                    full_content += chunk
-                    self._emit("agent_streaming", round_num, "discussion", agent.config.name, chunk, is_streaming=True)
+                async with self._sem:
+                    async for chunk in agent.think_stream(
+                        initial_prompt,
+                        system_prompt=system_prompt,
+                        identity_template=identity_template,
+                        context_messages=context_messages,
+                    ):
+                        if cancelled():
+                            break
+                        parts.append(chunk)
+                        buf.append(chunk)
+                        buf_len += len(chunk)
+                        if (buf_len >= self.STREAM_FLUSH_CHARS
+                                or loop.time() - last_flush > self.STREAM_FLUSH_SECS):
+                            flush()
+                flush()
+                full_content = "".join(parts)
+            except asyncio.CancelledError:
+                # cancel() fired mid-stream: keep whatever was streamed so far
+                full_content = "".join(parts)
             except Exception as e:
                 full_content = f"[Error: {e}]"
 
             turn = Turn(round=round_num, phase="discussion", content=full_content)
-            agent.turns.append(turn)
+            agent.record_turn(turn)
             self._emit("agent_speak", round_num, "discussion", agent.config.name, full_content)
+            self._emit_cache_stats(agent, round_num, "discussion")
 
             return agent.config.name, full_content
 
-        results = await asyncio.gather(*[
-            get_agent_response(agent) for agent in self.agents
-        ])
+        tasks = [asyncio.create_task(get_agent_response(agent)) for agent in self._non_leaders]
+
+        async def _watch_cancel() -> None:
+            # Cancel in-flight agent streams as soon as the user aborts,
+            # instead of letting every agent finish its response first.
+            await self._cancel_event.wait()
+            for task in tasks:
+                task.cancel()
+
+        watcher = asyncio.create_task(_watch_cancel())
+        try:
+            raw_results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            watcher.cancel()
+        results = [r for r in raw_results if isinstance(r, tuple)]
 
         # Store responses for moderator intervention
         self._last_round_responses = {
@@ -167,25 +294,35 @@ class DebateManager:
         if not self.leader:
             return
 
-        responses = getattr(self, "_last_round_responses", {})
+        responses = self._last_round_responses
 
-        context_parts = [
+        # The prompt grows as an exact superset of the previous round's prompt
+        # (original question, then each round's responses appended as a delta)
+        # so provider-side prefix caches keep hitting; only the trailing
+        # instruction changes between rounds.
+        if not self._moderator_context_prefix:
+            self._moderator_context_prefix = (
+                f"Original question: {self.config.debate.initial_prompt}\n\n"
+            )
+
+        delta_parts = [
             self.config.debate.round_header_template.format(round_num=round_num)
         ]
         for name, content in responses.items():
-            context_parts.append(f"\n### {name}\n{content}")
+            delta_parts.append(f"\n### {name}\n{content}")
+        delta = "\n".join(delta_parts) + "\n\n"
 
         is_last = round_num >= self.config.debate.rounds
         if is_last:
             instruction = self.config.debate.intervention_last_prompt
         else:
             instruction = self.config.debate.intervention_prompt
+        hint = self.config.debate.memory_reuse_hint
+        if hint:
+            instruction = f"{hint}\n\n{instruction}"
 
-        prompt = (
-            f"Original question: {self.config.debate.initial_prompt}\n\n"
-            + "\n".join(context_parts) + "\n\n"
-            + instruction
-        )
+        prompt = self._moderator_context_prefix + delta + instruction
+        self._moderator_context_prefix += delta
 
         self._emit("leader_section_start", round_num, "leader_intervention",
                    self.leader.config.name, f"## Round {round_num}")
@@ -194,7 +331,7 @@ class DebateManager:
         full_content = await self._stream_leader(prompt, round_num, "leader_intervention")
 
         turn = Turn(round=round_num, phase="leader_intervention", content=full_content)
-        self.leader.turns.append(turn)
+        self.leader.record_turn(turn)
         self._emit("leader_speak", round_num, "leader_intervention", self.leader.config.name, full_content)
 
         # Update context for agents in the next round
@@ -206,8 +343,7 @@ class DebateManager:
             return
 
         # Get the final synthesis
-        conclusion_turns = [t for t in self.leader.turns if t.phase == "conclusion"]
-        conclusion_text = conclusion_turns[-1].content if conclusion_turns else ""
+        conclusion_text = self._last_conclusion.content if self._last_conclusion else ""
 
         prompt = self.config.debate.continuation_prompt.format(
             initial_prompt=self.config.debate.initial_prompt,
@@ -217,13 +353,9 @@ class DebateManager:
         self._emit("continuation_thinking", 0, "end", self.leader.config.name, None)
 
         try:
-            from src.providers import Message
             response = await self.leader.provider.chat(
-                messages=[Message(role="user", content=prompt)],
-                system_prompt=self.leader.build_system_prompt(
-                    self.config.debate.system_prompt,
-                    identity_template=self.config.debate.agent_identity_template,
-                ),
+                messages=[Message(role=ROLE_USER, content=prompt)],
+                system_prompt=self._leader_system_prompt,
             )
             question = response.content.strip()
         except Exception:
@@ -239,8 +371,9 @@ class DebateManager:
         - The debate round counter is incremented by 1.
         """
         # Inject the final synthesis as starting context for the new round
-        conclusion_turns = [t for t in self.leader.turns if t.phase == "conclusion"] if self.leader else []
-        conclusion_text = conclusion_turns[-1].content if conclusion_turns else self._leader_last_content
+        conclusion_text = (
+            self._last_conclusion.content if self._last_conclusion else self._leader_last_content
+        )
 
         if conclusion_text:
             context_label = self.config.debate.previous_context_label.format(
@@ -252,7 +385,7 @@ class DebateManager:
         self.config.debate.rounds += 1
 
         # Reset internal manager state without touching agent histories
-        self._cancelled = False
+        self._cancel_event.clear()
         self._current_phase = ""
 
     def continue_with(self, new_prompt: str) -> None:
@@ -263,23 +396,20 @@ class DebateManager:
         - The leader's final synthesis is injected as starting context.
         """
         # Get the final synthesis before resetting everything
-        conclusion_turns = [t for t in self.leader.turns if t.phase == "conclusion"] if self.leader else []
-        conclusion_text = conclusion_turns[-1].content if conclusion_turns else ""
+        conclusion_text = self._last_conclusion.content if self._last_conclusion else ""
 
         # Reset non-leader agents
-        for agent in self.agents:
-            if agent != self.leader:
-                agent.history.clear()
-                agent.turns.clear()
+        for agent in self._non_leaders:
+            agent.history.clear()
+            agent.clear_turns()
 
         # Inject final synthesis into leader's LLM history
         if conclusion_text and self.leader:
-            from src.providers import Message as Msg
             label = self.config.debate.previous_debate_label.format(
                 initial_prompt=self.config.debate.initial_prompt,
             )
-            self.leader.history.append(Msg(
-                role="assistant",
+            self.leader.history.append(Message(
+                role=ROLE_ASSISTANT,
                 content=f"{label}\n{conclusion_text}",
             ))
 
@@ -296,10 +426,11 @@ class DebateManager:
             self._leader_last_content = ""
 
         # Reset internal manager state
-        self._cancelled = False
+        self._cancel_event.clear()
         self._current_round = 0
         self._current_phase = ""
-        self._last_round_responses: dict[str, str] = {}
+        self._moderator_context_prefix = ""
+        self._last_round_responses = {}
 
     async def _phase_conclusion(self) -> None:
         """Conclusion phase: the moderator provides the final synthesis."""
@@ -309,21 +440,28 @@ class DebateManager:
         if not self.leader:
             return
 
-        # Gather all agent history
-        all_turns_parts = []
-        for agent in self.agents:
-            if agent == self.leader:
-                continue
-            agent_turns = [t for t in agent.turns if t.phase == "discussion"]
-            if agent_turns:
-                all_turns_parts.append(f"### {agent.config.name}")
-                for t in agent_turns:
-                    all_turns_parts.append(f"*Round {t.round}:* {t.content}")
+        # Gather all agent history in a single pass over each agent's turns,
+        # streamed straight into one buffer instead of a list joined at the end
+        buf = io.StringIO()
+        w = buf.write
+        for agent in self._non_leaders:
+            header_emitted = False
+            for t in agent.turns_by_phase.get("discussion", ()):
+                if buf.tell():
+                    w("\n\n")
+                if not header_emitted:
+                    w(f"### {agent.config.name}\n\n")
+                    header_emitted = True
+                w(f"*Round {t.round}:* ")
+                w(t.content)
 
         prompt = self.config.debate.conclusion_prompt.format(
             initial_prompt=self.config.debate.initial_prompt,
-            turns="\n\n".join(all_turns_parts),
+            turns=buf.getvalue(),
         )
+        hint = self.config.debate.memory_reuse_hint
+        if hint:
+            prompt = f"{hint}\n\n{prompt}"
 
         self._emit("leader_section_start", self._current_round, "conclusion",
                    self.leader.config.name, "## Final Synthesis")
@@ -332,14 +470,30 @@ class DebateManager:
         full_content = await self._stream_leader(prompt, self._current_round, "conclusion")
 
         turn = Turn(round=self._current_round, phase="conclusion", content=full_content)
-        self.leader.turns.append(turn)
+        self.leader.record_turn(turn)
+        self._last_conclusion = turn
         self._emit("leader_speak", self._current_round, "conclusion", self.leader.config.name, full_content)
 
     async def _stream_leader(self, prompt: str, round_num: int, phase: str) -> str:
-        """Stream the leader's response and emit chunks."""
+        """Stream the leader's response and emit coalesced chunks."""
         if not self.leader:
             return ""
-        full_content = ""
+        loop = asyncio.get_running_loop()
+        cancelled = self._cancel_event.is_set
+        parts: list[str] = []
+        buf: list[str] = []
+        buf_len = 0
+        last_flush = loop.time()
+
+        def flush() -> None:
+            nonlocal buf, buf_len, last_flush
+            if buf:
+                self._emit("leader_streaming", round_num, phase,
+                           self.leader.config.name, "".join(buf), is_streaming=True)
+                buf = []
+                buf_len = 0
+            last_flush = loop.time()
+
         try:
             async for chunk in self.leader.think_stream(
                 prompt,
@@ -347,15 +501,36 @@ class DebateManager:
                 leader_prompt=self.config.debate.leader_prompt,
                 identity_template=self.config.debate.agent_identity_template,
             ):
-                if self._cancelled:
+                if cancelled():
                     break
-                full_content += chunk
-                self._emit("leader_streaming", round_num, phase,
-                           self.leader.config.name, chunk, is_streaming=True)
+                parts.append(chunk)
+                buf.append(chunk)
+                buf_len += len(chunk)
+                if (buf_len >= self.STREAM_FLUSH_CHARS
+                        or loop.time() - last_flush > self.STREAM_FLUSH_SECS):
+                    flush()
+            flush()
+            full_content = "".join(parts)
         except Exception as e:
             full_content = f"[Error: {e}]"
+        self._emit_cache_stats(self.leader, round_num, phase)
         return full_content
 
+    def _emit_cache_stats(self, agent: Agent, round_num: int, phase: str) -> None:
+        """Emit a cache_stats event when the provider reported cache usage."""
+        usage = agent.provider.last_usage
+        if not usage:
+            return
+        cache_read = usage.get("cache_read_input_tokens")
+        cache_write = usage.get("cache_creation_input_tokens")
+        if cache_read is None and cache_write is None:
+            return
+        self._emit(
+            "cache_stats", round_num, phase, agent.config.name,
+            f"cache_read_input_tokens={cache_read or 0} "
+            f"cache_creation_input_tokens={cache_write or 0}",
+        )
+
     def _emit(
         self,
         event_type: str,
@@ -365,6 +540,22 @@ class DebateManager:
         content: str | None,
         is_streaming: bool = False,
     ) -> None:
+        if is_streaming:
+            # Streaming chunks are ephemeral UI data: the full content is
+            # stored in the Turn anyway, so they are never kept in
+            # self.events, and with no listener no event is built at all.
+            if self.on_event is None:
+                return
+            self.on_event(DebateEvent(
+                type=event_type,
+                round=round_num,
+                phase=phase,
+                agent_name=agent_name,
+                content=content,
+                is_streaming=True,
+            ))
+            return
+
         event = DebateEvent(
             type=event_type,
             round=round_num,
@@ -377,32 +568,49 @@ class DebateManager:
         if self.on_event:
             self.on_event(event)
 
-    def save(self, path: str | None = None) -> str:
-        """Save the debate to Markdown. Returns the effective path."""
+    async def save(self, path: str | None = None, compress: bool = False) -> str:
+        """Save the debate to Markdown off the event loop. Returns the effective path.
+
+        With ``compress=True`` the document is gzip-compressed and the path
+        gains a ``.gz`` suffix; useful for very large debates.
+        """
         if path is None:
             path = datetime.now().strftime("debate_%Y-%m-%d_%H-%M.md")
-        content = self._build_markdown()
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        if compress and not path.endswith(".gz"):
+            path += ".gz"
+        await asyncio.to_thread(self._write, path, compress)
         return path
 
+    def _write(self, path: str, compress: bool = False) -> None:
+        """Write the Markdown document to disk in a single buffered pass."""
+        content = self._build_markdown()
+        if compress:
+            # Level 1: markdown compresses well already, favor speed
+            with gzip.open(path, "wt", encoding="utf-8", compresslevel=1) as f:
+                f.write(content)
+        else:
+            with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(content)
+
     def _build_markdown(self) -> str:
-        """Build the Markdown document of the debate from recorded turns."""
-        lines: list[str] = []
+        """Build the Markdown document of the debate from recorded turns.
+
+        Sections are written to a single StringIO buffer as whole f-strings
+        rather than growing a list of lines and joining at the end.
+        """
+        buf = io.StringIO()
+        w = buf.write
 
         title = self.config.title or "Agents Meeting"
-        lines.append(f"# {title}")
-        lines.append("")
-        lines.append(f"> {self.config.debate.initial_prompt}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        w(_MD_HEADER.format(title=title, prompt=self.config.debate.initial_prompt))
 
         # Leader section
         if self.leader:
-            model_info = f"{self.leader.config.provider} / {self.leader.config.model}"
-            lines.append(f"## {self.leader.config.name} ({model_info})")
-            lines.append("")
+            w(_MD_LEADER_HEADER.format(
+                name=self.leader.config.name,
+                provider=self.leader.config.provider,
+                model=self.leader.config.model,
+            ))
             phase_labels = {
                 "intro": "Debate Opening",
                 "conclusion": "Final Synthesis",
@@ -412,33 +620,26 @@ class DebateManager:
                 if label is None:
                     # leader_intervention for round N
                     label = f"Round {turn.round}"
-                lines.append(f"### {label}")
-                lines.append("")
-                lines.append(turn.content)
-                lines.append("")
+                w(_MD_LEADER_SECTION.format(label=label, content=turn.content))
 
-            lines.append("---")
-            lines.append("")
+            w("---\n\n")
 
         # Agents section
-        non_leaders = [a for a in self.agents if a != self.leader]
-        if non_leaders:
-            lines.append("## Agents")
-            lines.append("")
-            for agent in non_leaders:
-                model_info = f"{agent.config.provider} / {agent.config.model}"
-                lines.append(f"### {agent.config.name} ({model_info})")
+        if self._non_leaders:
+            w("## Agents\n\n")
+            for agent in self._non_leaders:
+                w(_MD_AGENT_HEADER.format(
+                    name=agent.config.name,
+                    provider=agent.config.provider,
+                    model=agent.config.model,
+                ))
                 if agent.config.role:
-                    lines.append(f"*{agent.config.role}*")
-                lines.append("")
-                for turn in agent.turns:
-                    if turn.phase == "discussion":
-                        lines.append(f"**Round {turn.round}**")
-                        lines.append("")
-                        lines.append(turn.content)
-                        lines.append("")
-
-        return "\n".join(lines)
+                    w(f"*{agent.config.role}*\n")
+                w("\n")
+                for turn in agent.turns_by_phase.get("discussion", ()):
+                    w(_MD_AGENT_TURN.format(round=turn.round, content=turn.content))
+
+        return buf.getvalue()
 
     async def cleanup(self) -> None:
         """Clean up resources."""
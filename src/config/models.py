@@ -1,7 +1,7 @@
 """Configuration for agents-meeting project."""
 
 import os
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from typing import Any
 
 
@@ -17,6 +17,10 @@ class APIKeysConfig(BaseModel):
         default=None, description="LM Studio API key (optional, not required by default)"
     )
 
+    # Keys resolved once at load time so resolve_api_key never hits os.getenv
+    # on the hot path.
+    _resolved: dict[str, str | None] = PrivateAttr(default_factory=dict)
+
     @field_validator("openai", "anthropic", "gemini", "custom")
     @classmethod
     def resolve_env_var(cls, v: str | None) -> str | None:
@@ -25,6 +29,17 @@ class APIKeysConfig(BaseModel):
             return os.getenv(env_name) or v
         return v
 
+    def model_post_init(self, __context: Any) -> None:
+        for name in type(self).model_fields:
+            value = getattr(self, name)
+            if value and value.startswith("env:"):
+                value = os.getenv(value[4:])
+            self._resolved[name] = value
+
+    def resolved_key(self, provider: str) -> str | None:
+        """Return the pre-resolved key for ``provider`` (None if unset)."""
+        return self._resolved.get(provider)
+
 
 class AgentConfig(BaseModel):
     """Configuration for an agent."""
@@ -40,19 +55,34 @@ class AgentConfig(BaseModel):
     api_key: str | None = Field(default=None, description="API key (or env:VAR_NAME)")
     base_url: str | None = Field(default=None, description="API URL")
     is_leader: bool = Field(default=False, description="This agent is the leader/moderator")
+    history_token_budget: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Approximate token budget for the agent's conversation history. "
+            "When exceeded, older turns are compressed into a single summary "
+            "message. Disabled by default (history grows unbounded)."
+        ),
+    )
     extra: dict[str, Any] = Field(default_factory=dict, description="Additional parameters")
 
-    def resolve_api_key(self, global_keys: APIKeysConfig | None = None) -> str | None:
-        """Resolve the API key (local or global)."""
+    # Resolved once at load time; see APIKeysConfig._resolved.
+    _resolved_api_key: str | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
         if self.api_key:
             if self.api_key.startswith("env:"):
-                return os.getenv(self.api_key[4:])
-            return self.api_key
+                self._resolved_api_key = os.getenv(self.api_key[4:])
+            else:
+                self._resolved_api_key = self.api_key
+
+    def resolve_api_key(self, global_keys: APIKeysConfig | None = None) -> str | None:
+        """Resolve the API key (local or global). Env lookups happen at load time."""
+        if self.api_key:
+            return self._resolved_api_key
         if global_keys:
-            provider_key = getattr(global_keys, self.provider, None)
+            provider_key = global_keys.resolved_key(self.provider)
             if provider_key:
-                if provider_key.startswith("env:"):
-                    return os.getenv(provider_key[4:])
                 return provider_key
         return None
 
@@ -61,6 +91,16 @@ class DebateConfig(BaseModel):
     """Configuration for the debate."""
 
     rounds: int = Field(default=2, ge=1, le=10, description="Number of discussion rounds")
+    max_concurrent_agents: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Maximum number of agents queried in parallel per round. "
+            "Defaults to all agents at once. Set this to the backend's true "
+            "parallelism (e.g. OLLAMA_NUM_PARALLEL for Ollama) to avoid "
+            "queueing inside the provider's HTTP stack."
+        ),
+    )
     initial_prompt: str = Field(..., description="Initial question/prompt")
     system_prompt: str | None = Field(
         default=None, description="Optional system prompt for all agents"
@@ -100,6 +140,19 @@ class DebateConfig(BaseModel):
         ),
     )
 
+    memory_reuse_hint: str = Field(
+        default=(
+            "Build on the synthesis from previous rounds already in your context; "
+            "do not restate prior framing — only add new insight."
+        ),
+        description=(
+            "Directive prepended to the moderator's synthesis and conclusion "
+            "prompts so it reuses prior context instead of regenerating it "
+            "(shorter output, lower latency and cost). Set to an empty string "
+            "to disable."
+        ),
+    )
+
     intervention_prompt: str = Field(
         default=(
             "As moderator, synthesize the positions expressed this round, "
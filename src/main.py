@@ -1,8 +1,10 @@
 """Main entry point."""
 
-import argparse
 import asyncio
+import copy
+import os
 import sys
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -12,13 +14,45 @@ from src.config import MeetingConfig
 from src.tui import AgentsMeetingApp
 
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as
+# SafeLoader but parses several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Parsed configs keyed by (abspath, mtime_ns, size) so reloading the same
+# unchanged file skips I/O and YAML parsing. Small LRU; entries for edited
+# files age out naturally because the mtime key no longer matches.
+_CONFIG_CACHE: OrderedDict[tuple[str, int, int], MeetingConfig] = OrderedDict()
+_CONFIG_CACHE_MAX = 32
+
+
 def load_config(path: str | Path) -> MeetingConfig:
-    """Load configuration from a YAML file."""
-    with open(path) as f:
-        data = yaml.safe_load(f)
-    return MeetingConfig(**data)
+    """Load configuration from a YAML file (cached by path + mtime + size)."""
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        _CONFIG_CACHE.move_to_end(key)
+        # Deep copy so callers mutating the config (e.g. --prompt override)
+        # don't poison the cache.
+        return copy.deepcopy(cached)
+
+    # Binary mode lets libyaml handle the utf-8 decoding itself
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    config = MeetingConfig(**data)
+
+    _CONFIG_CACHE[key] = config
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
 
 
+def _head(s: str, n: int = 500) -> str:
+    """Truncate for display; returns the string itself when already short."""
+    return s if len(s) <= n else s[:n]
+
 
 async def run_cli(config: MeetingConfig) -> None:
     """Run the debate in CLI mode with real-time display."""
@@ -29,30 +63,42 @@ async def run_cli(config: MeetingConfig) -> None:
     print(f"{'='*60}")
     print(f"\nQuestion: {config.debate.initial_prompt}\n")
     
+    out = sys.stdout
+
     def on_event(event: DebateEvent):
-        if event.type == "phase_start":
+        # agent_streaming fires once per token chunk, so it is matched first;
+        # everything else happens a handful of times per debate.
+        event_type = event.type
+        content = event.content
+        if event_type == "agent_streaming" and content:
+            # The manager already coalesces chunks; flushing only on newline
+            # (instead of per chunk) cuts write syscalls further while the
+            # final flush below guarantees nothing is left buffered.
+            out.write(content)
+            if "\n" in content:
+                out.flush()
+        elif event_type == "phase_start":
             print(f"\n[{'='*40}]")
             print(f"  Phase: {event.phase.upper()}")
             print(f"[{'='*40}]")
-        elif event.type == "leader_thinking":
+        elif event_type == "leader_thinking":
             print(f"\n  💭 {event.agent_name} is thinking...")
-        elif event.type == "agent_thinking":
+        elif event_type == "agent_thinking":
             print(f"\n  💭 {event.agent_name} is thinking...")
-        elif event.type == "leader_speak" and event.content:
+        elif event_type == "leader_speak" and content:
             print(f"\n🎤 {event.agent_name}:")
-            print(f"   {event.content[:500]}")
-        elif event.type == "leader_intervention" and event.content:
+            print(f"   {_head(content)}")
+        elif event_type == "leader_intervention" and content:
             print(f"\n🔧 MODERATOR INTERVENTION:")
-            print(f"   {event.content[:500]}")
-        elif event.type == "agent_speak" and event.content:
+            print(f"   {_head(content)}")
+        elif event_type == "agent_speak" and content:
             print(f"\n💬 {event.agent_name}:")
-            print(f"   {event.content[:500]}")
-        elif event.type == "agent_streaming" and event.content:
-            print(event.content, end="", flush=True)
-        elif event.type == "end":
+            print(f"   {_head(content)}")
+        elif event_type == "end":
             print(f"\n{'='*60}")
             print(f"  ✅ Debate ended!")
             print(f"{'='*60}\n")
+            out.flush()
     
     manager = DebateManager(config, on_event=on_event)
     await manager.initialize()
@@ -61,19 +107,21 @@ async def run_cli(config: MeetingConfig) -> None:
 
     # Offer to save
     if config.output:
-        path = manager.save(config.output)
+        path = await manager.save(config.output)
         print(f"\nConversation saved: {path}")
     else:
         default = datetime.now().strftime("debate_%Y-%m-%d_%H-%M.md")
         try:
-            answer = input(f"\nSave file name [{default}] : ").strip()
+            # Off the loop thread so lingering cleanup tasks keep running
+            answer = await asyncio.to_thread(input, f"\nSave file name [{default}] : ")
+            answer = answer.strip()
         except (EOFError, KeyboardInterrupt):
             answer = ""
         if answer == "":
             answer = default
         if not answer.endswith(".md"):
             answer += ".md"
-        path = manager.save(answer)
+        path = await manager.save(answer)
         print(f"Conversation saved: {path}")
 
 
@@ -83,36 +131,76 @@ async def run_tui(config: MeetingConfig) -> None:
     await app.run_async()
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Agents Meeting - Multi-agent debate system")
-    parser.add_argument(
-        "config",
-        nargs="?",
-        help="Path to the YAML configuration file",
-    )
-    parser.add_argument(
-        "--prompt",
-        type=str,
-        help="Prompt/direct question for the debate (replaces config)",
-    )
-    parser.add_argument(
-        "--cli",
-        action="store_true",
-        help="CLI mode (without TUI)",
-    )
-    
-    args = parser.parse_args()
+def _parse_args_fast(argv: list[str]) -> tuple[str | None, str | None, bool] | None:
+    """Hand-rolled parse of the tiny CLI surface (config, --prompt, --cli).
+
+    Skips importing and building argparse on the common invocation, which is
+    a measurable share of cold start. Returns None when argparse must take
+    over (--help or anything unrecognized).
+    """
+    config_path: str | None = None
+    prompt: str | None = None
+    cli_mode = False
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--cli":
+            cli_mode = True
+        elif arg == "--prompt":
+            i += 1
+            if i >= len(argv):
+                return None
+            prompt = argv[i]
+        elif arg.startswith("--prompt="):
+            prompt = arg[len("--prompt="):]
+        elif arg.startswith("-"):
+            # -h/--help or an unknown flag: let argparse handle it
+            return None
+        elif config_path is None:
+            config_path = arg
+        else:
+            return None
+        i += 1
+    return config_path, prompt, cli_mode
+
 
-    if args.config:
-        config = load_config(args.config)
+def main() -> None:
+    parsed = _parse_args_fast(sys.argv)
+    if parsed is None:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Agents Meeting - Multi-agent debate system")
+        parser.add_argument(
+            "config",
+            nargs="?",
+            help="Path to the YAML configuration file",
+        )
+        parser.add_argument(
+            "--prompt",
+            type=str,
+            help="Prompt/direct question for the debate (replaces config)",
+        )
+        parser.add_argument(
+            "--cli",
+            action="store_true",
+            help="CLI mode (without TUI)",
+        )
+
+        args = parser.parse_args()
+        parsed = (args.config, args.prompt, args.cli)
+
+    config_path, prompt, cli_mode = parsed
+
+    if config_path:
+        config = load_config(config_path)
     else:
         print("Error: Provide a config file.")
         sys.exit(1)
 
-    if args.prompt:
-        config.debate.initial_prompt = args.prompt
+    if prompt:
+        config.debate.initial_prompt = prompt
 
-    if args.cli:
+    if cli_mode:
         asyncio.run(run_cli(config))
     else:
         asyncio.run(run_tui(config))
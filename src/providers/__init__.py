@@ -1,17 +1,26 @@
 """LLM providers for agents-meeting."""
 
-from .base import LLMProvider, Message, Response
-from .openai import OpenAIProvider
-from .anthropic import AnthropicProvider
-from .ollama import OllamaProvider
-from .custom import CustomProvider
-from .gemini import GeminiProvider
-from .lmstudio import LMStudioProvider
+from .base import LLMProvider, Message, Response, ROLE_ASSISTANT, ROLE_SYSTEM, ROLE_USER
+
+# Provider classes are loaded lazily (PEP 562): each one drags in its SDK
+# (openai, anthropic, google.genai, httpx...), so eager imports here would
+# cost hundreds of ms of startup even for configs using a single provider.
+_PROVIDER_MODULES = {
+    "OpenAIProvider": "openai",
+    "AnthropicProvider": "anthropic",
+    "OllamaProvider": "ollama",
+    "CustomProvider": "custom",
+    "GeminiProvider": "gemini",
+    "LMStudioProvider": "lmstudio",
+}
 
 __all__ = [
     "LLMProvider",
     "Message",
     "Response",
+    "ROLE_ASSISTANT",
+    "ROLE_SYSTEM",
+    "ROLE_USER",
     "OpenAIProvider",
     "AnthropicProvider",
     "OllamaProvider",
@@ -19,3 +28,15 @@ __all__ = [
     "GeminiProvider",
     "LMStudioProvider",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
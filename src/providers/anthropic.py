@@ -1,11 +1,22 @@
 """Anthropic provider."""
 
 import os
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable
 
 from anthropic import AsyncAnthropic
 
-from .base import LLMProvider, Message, Response
+from .base import LLMProvider, Message, Response, ROLE_SYSTEM
+
+# Read once at import: the environment doesn't change mid-process and a
+# debate may construct many providers.
+_DEFAULT_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+
+# One AsyncAnthropic client (and thus one httpx connection pool / TLS
+# session) per (api_key, base_url) pair, shared by every provider instance
+# targeting the same endpoint. Refcounted so close() only tears the client
+# down once the last provider using it is closed.
+_CLIENT_CACHE: dict[tuple[str | None, str | None], AsyncAnthropic] = {}
+_CLIENT_REFS: dict[tuple[str | None, str | None], int] = {}
 
 
 class AnthropicProvider(LLMProvider):
@@ -18,36 +29,93 @@ class AnthropicProvider(LLMProvider):
         max_tokens: int | None = None,
         api_key: str | None = None,
         base_url: str | None = None,
+        cache_system: bool = False,
         **kwargs: Any
     ):
         super().__init__(model, temperature, max_tokens, **kwargs)
-        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.api_key = api_key or _DEFAULT_API_KEY
         self.base_url = base_url
+        self.cache_system = cache_system
         self._client: AsyncAnthropic | None = None
+        self._client_key: tuple[str | None, str | None] | None = None
 
     @property
     def client(self) -> AsyncAnthropic:
         if self._client is None:
-            self._client = AsyncAnthropic(
-                api_key=self.api_key,
-                base_url=self.base_url,
-            )
+            key = (self.api_key, self.base_url)
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = AsyncAnthropic(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                )
+                _CLIENT_CACHE[key] = client
+            _CLIENT_REFS[key] = _CLIENT_REFS.get(key, 0) + 1
+            self._client = client
+            self._client_key = key
         return self._client
 
+    def _system_param(self, system_prompt: str) -> str | list[dict[str, Any]]:
+        """Build the `system` field, marking it cacheable when enabled.
+
+        With ``cache_system=True`` the system prompt is sent as a content
+        block carrying ``cache_control: ephemeral`` so Anthropic caches the
+        static prefix: the debate loops resend the same system prompt every
+        round, and cached-prefix reads are billed at a fraction of the
+        normal input cost.
+        """
+        if self.cache_system:
+            return [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        return system_prompt
+
+    @staticmethod
+    def _split_system(
+        messages: Iterable[Message],
+        system_prompt: str | None,
+    ) -> tuple[str | None, list[dict[str, str]]]:
+        """Extract the system prompt and build the API message list.
+
+        Anthropic takes the system prompt as a dedicated parameter, so
+        system-role messages are filtered out of the list; the first one
+        becomes the system prompt when none was given. ``messages`` may be a
+        single-use iterable, hence the materialization before the second scan.
+        """
+        if system_prompt is None:
+            messages = list(messages)
+            system_prompt = next(
+                (m.content for m in messages if m.role == ROLE_SYSTEM), None
+            )
+        api_messages = [m.as_openai() for m in messages if m.role != ROLE_SYSTEM]
+        return system_prompt, api_messages
+
+    @staticmethod
+    def _usage_dict(usage: Any) -> dict | None:
+        if not usage:
+            return None
+        result = {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+        }
+        cache_creation = getattr(usage, "cache_creation_input_tokens", None)
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        if cache_creation is not None:
+            result["cache_creation_input_tokens"] = cache_creation
+        if cache_read is not None:
+            result["cache_read_input_tokens"] = cache_read
+        return result
+
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
-        api_messages = []
-        for m in messages:
-            if m.role == "system" and not system_prompt:
-                system_prompt = m.content
-            else:
-                api_messages.append({
-                    "role": m.role,
-                    "content": m.content
-                })
+        system_prompt, api_messages = self._split_system(messages, system_prompt)
 
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -55,36 +123,31 @@ class AnthropicProvider(LLMProvider):
             "temperature": self.temperature,
         }
         if system_prompt:
-            kwargs["system"] = system_prompt
+            kwargs["system"] = self._system_param(system_prompt)
         if self.max_tokens:
             kwargs["max_tokens"] = self.max_tokens
 
         response = await self.client.messages.create(**kwargs)
-        content = response.content[0].text if response.content else ""
+        # Long responses can span several content blocks; join every text
+        # block instead of reading only the first.
+        content = "".join(
+            b.text for b in (response.content or ()) if getattr(b, "text", None)
+        )
+        usage = self._usage_dict(response.usage)
+        self.last_usage = usage
         return Response(
             content=content,
             model=response.model,
             raw_response=response,
-            usage={
-                "input_tokens": response.usage.input_tokens,
-                "output_tokens": response.usage.output_tokens,
-            } if response.usage else None,
+            usage=usage,
         )
 
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
-        api_messages = []
-        for m in messages:
-            if m.role == "system" and not system_prompt:
-                system_prompt = m.content
-            else:
-                api_messages.append({
-                    "role": m.role,
-                    "content": m.content
-                })
+        system_prompt, api_messages = self._split_system(messages, system_prompt)
 
         kwargs: dict[str, Any] = {
             "model": self.model,
@@ -93,13 +156,27 @@ class AnthropicProvider(LLMProvider):
             "stream": True,
         }
         if system_prompt:
-            kwargs["system"] = system_prompt
+            kwargs["system"] = self._system_param(system_prompt)
         if self.max_tokens:
             kwargs["max_tokens"] = self.max_tokens
 
         async with self.client.messages.stream(**kwargs) as stream:
             async for text in stream.text_stream:
                 yield text
+            final = await stream.get_final_message()
+            self.last_usage = self._usage_dict(final.usage)
 
     async def close(self) -> None:
+        if self._client is None:
+            return
+        key = self._client_key
         self._client = None
+        self._client_key = None
+        refs = _CLIENT_REFS.get(key, 0) - 1
+        if refs > 0:
+            _CLIENT_REFS[key] = refs
+            return
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENT_CACHE.pop(key, None)
+        if client is not None:
+            await client.close()
@@ -1,21 +1,175 @@
 """Base classes for LLM providers."""
 
+import json
 import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, AsyncGenerator, Coroutine, TypeVar
+from itertools import chain
+from typing import Any, AsyncGenerator, Coroutine, Iterable, TypeVar
 
+try:
+    # Optional C-accelerated JSON codec shared by the HTTP providers;
+    # streaming paths decode one payload per token, so the per-call cost
+    # matters. Both callables accept/produce bytes as well as str.
+    import orjson
 
-@dataclass
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Interned role strings shared by every Message so the thousands of messages
+# built over a debate reference the same string objects.
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+ROLE_SYSTEM = sys.intern("system")
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+# Matches either tag so the stream filter walks each chunk in one pass of the
+# C regex engine instead of alternating two str.find scans.
+_THINK_TAG_RE = re.compile(r"</?think>")
+
+
+class ThinkTagFilter:
+    """Incremental filter removing <think>...</think> blocks from a stream.
+
+    Shared by the Ollama and LM Studio streaming paths, which previously
+    each kept their own copy of this state machine and re-sliced the whole
+    buffer on every chunk (O(n²) over a long stream). The filter keeps one
+    persistent buffer with a read cursor and a scan cursor, so each chunk is
+    scanned once and already-searched text is never rescanned while waiting
+    for a tag to complete.
+    """
+
+    # Compact the buffer once this much consumed text has accumulated.
+    _COMPACT_AT = 64 * 1024
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._pos = 0  # start of unconsumed text
+        self._scan = 0  # resume point for tag searches
+        self._in_think = False
+        self._just_closed = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk and return the visible text it completes."""
+        # Fast paths: a tag can only start at a '<', so a chunk without one
+        # needs no regex scan. Outside a think block (with nothing buffered)
+        # it is pure visible text; inside one it is just more text to skip.
+        if "<" not in chunk:
+            if not self._in_think and not self._buf:
+                if self._just_closed:
+                    chunk = chunk.lstrip("\n")
+                    if chunk:
+                        self._just_closed = False
+                return chunk
+            if self._in_think and "<" not in self._buf[self._scan:]:
+                self._buf += chunk
+                self._scan = len(self._buf)
+                return ""
+        self._buf += chunk
+        parts: list[str] = []
+        in_think = self._in_think
+        just_closed = self._just_closed
+        pos = self._pos
+        # One linear scan per chunk; a stray tag of the wrong kind (e.g. a
+        # closing tag while outside a think block) is plain text and is left
+        # inside the surrounding slice.
+        for m in _THINK_TAG_RE.finditer(self._buf, self._scan):
+            if in_think:
+                if m.group() == _THINK_CLOSE:
+                    pos = m.end()
+                    in_think = False
+                    just_closed = True
+            elif m.group() == _THINK_OPEN:
+                if m.start() > pos:
+                    parts.append(self._buf[pos:m.start()])
+                pos = m.end()
+                in_think = True
+                just_closed = False
+        if in_think:
+            # Tag may straddle the chunk boundary: keep the last len-1
+            # characters searchable, skip the rest next time.
+            self._pos = pos
+            self._scan = max(pos, len(self._buf) - len(_THINK_CLOSE) + 1)
+            self._in_think = True
+            self._just_closed = just_closed
+            self._compact()
+        else:
+            if just_closed:
+                # Advance the cursor over leading newlines instead of
+                # slicing then lstrip-ing (two copies of the whole tail).
+                end = len(self._buf)
+                while pos < end and self._buf[pos] == "\n":
+                    pos += 1
+            parts.append(self._buf[pos:])
+            self._buf = ""
+            self._pos = self._scan = 0
+            self._in_think = False
+            self._just_closed = False
+        return "".join(parts)
+
+    def flush(self) -> str:
+        """Return any trailing visible text once the stream ends."""
+        if self._in_think or self._pos >= len(self._buf):
+            return ""
+        pos = self._pos
+        if self._just_closed:
+            end = len(self._buf)
+            while pos < end and self._buf[pos] == "\n":
+                pos += 1
+        text = self._buf[pos:]
+        self._buf = ""
+        self._pos = self._scan = 0
+        return text
+
+    def _compact(self) -> None:
+        if self._pos > self._COMPACT_AT:
+            self._buf = self._buf[self._pos:]
+            self._scan -= self._pos
+            self._pos = 0
+
+
+@dataclass(slots=True, frozen=True)
 class Message:
-    """Represents a message in a conversation."""
+    """Represents a message in a conversation.
+
+    Slotted and frozen: debates accumulate hundreds of these per agent, so
+    dropping the per-instance __dict__ saves memory and makes attribute reads
+    a C-level slot lookup; immutability also makes messages hashable.
+    """
 
     role: str
     content: str
     name: str | None = None
+    # Lazily-filled cache slot for as_openai(); excluded from init, repr,
+    # equality and hashing.
+    _openai_dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def as_openai(self) -> dict:
+        """Return the OpenAI-format payload dict for this message, cached.
+
+        History messages are re-serialized on every call of a debate; caching
+        the dict on the (immutable) message means each one is built exactly
+        once. Callers must not mutate the returned dict.
+        """
+        d = self._openai_dict
+        if d is None:
+            d = {"role": self.role, "content": self.content}
+            if self.name is not None:
+                d["name"] = self.name
+            object.__setattr__(self, "_openai_dict", d)
+        return d
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Response:
     """Represents a response from an LLM provider."""
 
@@ -35,20 +189,25 @@ class LLMProvider(ABC):
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.extra_kwargs = kwargs
+        self.last_usage: dict | None = None
 
     @abstractmethod
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
-        """Send a chat request and return the response."""
+        """Send a chat request and return the response.
+
+        ``messages`` may be any single-use iterable; implementations must
+        iterate it exactly once when building their API payload.
+        """
         pass
 
     @abstractmethod
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
         """Streaming version of chat."""
@@ -62,14 +221,14 @@ class LLMProvider(ABC):
     def build_messages(
         self,
         user_prompt: str,
-        history: list[Message] | None = None,
-    ) -> list[Message]:
-        """Build the list of messages for the API."""
-        msgs = []
-        if history:
-            msgs.extend(history)
-        msgs.append(Message(role="user", content=user_prompt))
-        return msgs
+        history: Iterable[Message] | None = None,
+    ) -> Iterable[Message]:
+        """Build the message sequence for the API.
+
+        Returns a lazily-chained iterable instead of copying the history into
+        a fresh list on every turn; chat/chat_stream only iterate it once.
+        """
+        return chain(history or (), (Message(role=ROLE_USER, content=user_prompt),))
 
     @staticmethod
     def strip_thinking(text: str) -> str:
@@ -78,8 +237,26 @@ class LLMProvider(ABC):
         Some local models (DeepSeek-R1, QwQ, etc.) embed their chain-of-thought
         inside <think> tags inline with the response text. This method strips
         those blocks and trims any leading/trailing whitespace left behind.
+
+        Most cloud-model responses never contain <think>, so a C-level
+        substring check gates the removal loop. Blocks are cut out with
+        str.partition, which locates the tag and splits in one C call; an
+        unclosed <think> block is left in place.
         """
-        return re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+        if "<think>" not in text:
+            return text.strip()
+        parts: list[str] = []
+        rest = text
+        while True:
+            head, sep, rest = rest.partition(_THINK_OPEN)
+            parts.append(head)
+            if not sep:
+                break
+            inner, sep, rest = rest.partition(_THINK_CLOSE)
+            if not sep:
+                parts.append(_THINK_OPEN + inner)
+                break
+        return "".join(parts).strip()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model})"
@@ -1,10 +1,21 @@
 """Custom provider for third-party APIs."""
 
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable
 
 import httpx
 
-from .base import LLMProvider, Message, Response
+from .base import LLMProvider, Message, Response, json_dumps, json_loads
+
+# Serializing ourselves (rather than httpx's json=) means one encode pass
+# straight to bytes; the content type must then be set explicitly.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One httpx client per (base_url, headers) pair so all agents hitting the
+# same endpoint share a connection pool; HTTP/2 lets their streams multiplex
+# over a single TCP+TLS session. Refcounted so close() tears the client down
+# only when the last provider using it is closed.
+_CLIENT_CACHE: dict[tuple, httpx.AsyncClient] = {}
+_CLIENT_REFS: dict[tuple, int] = {}
 
 
 class CustomProvider(LLMProvider):
@@ -31,33 +42,39 @@ class CustomProvider(LLMProvider):
         self.request_format = request_format
         self.response_format = response_format
         self._client: httpx.AsyncClient | None = None
+        self._client_key: tuple | None = None
 
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=120.0, headers=self.headers)
+            key = (self.base_url, tuple(sorted(self.headers.items())))
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=120.0,
+                    headers=self.headers,
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                )
+                _CLIENT_CACHE[key] = client
+            _CLIENT_REFS[key] = _CLIENT_REFS.get(key, 0) + 1
+            self._client = client
+            self._client_key = key
         return self._client
 
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
         if self.request_format == "openai":
+            msgs = [{"role": "system", "content": system_prompt}] if system_prompt else []
+            msgs += [m.as_openai() for m in messages]
             payload: dict[str, Any] = {
                 "model": self.model,
-                "messages": [],
+                "messages": msgs,
                 "temperature": self.temperature,
             }
-            if system_prompt:
-                payload["messages"].append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            payload["messages"].extend([
-                {"role": m.role, "content": m.content}
-                for m in messages
-            ])
             if self.max_tokens:
                 payload["max_tokens"] = self.max_tokens
             endpoint = "/chat/completions"
@@ -66,7 +83,8 @@ class CustomProvider(LLMProvider):
 
         response = await self.client.post(
             f"{self.base_url}{endpoint}",
-            json=payload,
+            content=json_dumps(payload),
+            headers=_JSON_HEADERS,
         )
         response.raise_for_status()
         data = response.json()
@@ -83,48 +101,60 @@ class CustomProvider(LLMProvider):
 
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
         if self.request_format != "openai":
             raise ValueError(f"Streaming non supporté pour le format: {self.request_format}")
 
+        msgs = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        msgs += [m.as_openai() for m in messages]
         payload: dict[str, Any] = {
             "model": self.model,
-            "messages": [],
+            "messages": msgs,
             "temperature": self.temperature,
             "stream": True,
         }
-        if system_prompt:
-            payload["messages"].append({
-                "role": "system",
-                "content": system_prompt
-            })
-        payload["messages"].extend([
-            {"role": m.role, "content": m.content}
-            for m in messages
-        ])
         if self.max_tokens:
             payload["max_tokens"] = self.max_tokens
 
         async with self.client.stream(
             "POST",
             f"{self.base_url}/chat/completions",
-            json=payload,
+            content=json_dumps(payload),
+            headers=_JSON_HEADERS,
         ) as response:
             response.raise_for_status()
-            async for line in response.aiter_lines():
-                if line.strip() and line.startswith("data: "):
-                    data_str = line[6:]
-                    if data_str == "[DONE]":
-                        break
-                    data = eval(data_str)
+            # Split the SSE stream at the byte level: keepalives and comment
+            # lines are skipped before any utf-8 decode or str allocation.
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf += chunk
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl]).rstrip(b"\r")
+                    del buf[: nl + 1]
+                    if not line.startswith(b"data: "):
+                        continue
+                    payload_bytes = line[6:]
+                    if payload_bytes == b"[DONE]":
+                        return
+                    data = json_loads(payload_bytes)
                     if "choices" in data and data["choices"]:
                         content = data["choices"][0].get("delta", {}).get("content")
                         if content:
                             yield content
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        if self._client is None:
+            return
+        key = self._client_key
+        self._client = None
+        self._client_key = None
+        refs = _CLIENT_REFS.get(key, 0) - 1
+        if refs > 0:
+            _CLIENT_REFS[key] = refs
+            return
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENT_CACHE.pop(key, None)
+        if client is not None:
+            await client.aclose()
@@ -1,13 +1,17 @@
 """Google Gemini provider."""
 
 import os
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable
 
 from google import genai
 from google.genai import types
 
 from .base import LLMProvider, Message, Response
 
+# Read once at import: the environment doesn't change mid-process and a
+# debate may construct many providers.
+_DEFAULT_API_KEY = os.getenv("GEMINI_API_KEY")
+
 
 class GeminiProvider(LLMProvider):
     """Provider for Google Gemini API."""
@@ -21,7 +25,7 @@ class GeminiProvider(LLMProvider):
         **kwargs: Any,
     ):
         super().__init__(model, temperature, max_tokens, **kwargs)
-        self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self.api_key = api_key or _DEFAULT_API_KEY
         self._client: genai.Client | None = None
 
     @property
@@ -32,7 +36,7 @@ class GeminiProvider(LLMProvider):
 
     def _build_contents(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
     ) -> list[types.Content]:
         """Convert internal Message list to Gemini contents format.
 
@@ -68,7 +72,7 @@ class GeminiProvider(LLMProvider):
 
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
         contents = self._build_contents(messages)
@@ -100,7 +104,7 @@ class GeminiProvider(LLMProvider):
 
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
         contents = self._build_contents(messages)
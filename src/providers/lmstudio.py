@@ -1,16 +1,21 @@
 """LM Studio provider (local) — uses the OpenAI-compatible /v1/chat/completions API."""
 
-from typing import Any, AsyncGenerator, Literal
+from typing import Any, AsyncGenerator, Iterable, Literal
 
 from openai import AsyncOpenAI
 
-from .base import LLMProvider, Message, Response
+from .base import LLMProvider, Message, Response, ThinkTagFilter
 
 # Reasoning levels understood by this provider.
 # "off"  → injects /no_think into the system prompt (DeepSeek/QwQ convention).
 # Others → accepted but have no effect; the model decides on its own.
 ReasoningLevel = Literal["off", "low", "medium", "high", "on"]
 
+# One AsyncOpenAI client per (api_key, base_url) pair, shared by every
+# provider instance targeting the same LM Studio endpoint; refcounted close.
+_CLIENT_CACHE: dict[tuple[str, str], AsyncOpenAI] = {}
+_CLIENT_REFS: dict[tuple[str, str], int] = {}
+
 
 class LMStudioProvider(LLMProvider):
     """Provider for LM Studio using the OpenAI-compatible /v1/chat/completions endpoint.
@@ -37,57 +42,73 @@ class LMStudioProvider(LLMProvider):
         # LM Studio does not require a real API key; use a placeholder if none given.
         self.api_key = api_key or "lm-studio"
         self.reasoning = reasoning
+        self._reasoning_prefix = "/no_think\n" if reasoning == "off" else ""
+        # Invariant part of the per-call kwargs, merged with the messages
+        # list on each request.
+        base: dict[str, Any] = {"model": model, "temperature": temperature}
+        if max_tokens:
+            base["max_tokens"] = max_tokens
+        self._base_kwargs = base
+        self._base_stream_kwargs = base | {"stream": True}
         self._client: AsyncOpenAI | None = None
+        self._client_key: tuple[str, str] | None = None
+        # Last system prompt seen and its prebuilt message dict. Debates
+        # reuse one prompt object across every turn, so keying on identity
+        # skips _apply_reasoning and the dict build in the steady state.
+        self._sys_msg_cache: tuple[str, dict[str, Any]] | None = None
 
     @property
     def client(self) -> AsyncOpenAI:
         if self._client is None:
-            self._client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url,
-            )
+            key = (self.api_key, self.base_url)
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                )
+                _CLIENT_CACHE[key] = client
+            _CLIENT_REFS[key] = _CLIENT_REFS.get(key, 0) + 1
+            self._client = client
+            self._client_key = key
         return self._client
 
     def _apply_reasoning(self, system_prompt: str | None) -> str | None:
         """Prepend /no_think to the system prompt when reasoning is disabled."""
-        if self.reasoning == "off":
-            prefix = "/no_think\n"
-            return prefix + (system_prompt or "")
-        return system_prompt
+        prefix = self._reasoning_prefix
+        if not prefix:
+            return system_prompt
+        return prefix + (system_prompt or "")
 
     def _build_api_messages(
-        self, messages: list[Message], system_prompt: str | None
+        self, messages: Iterable[Message], system_prompt: str | None
     ) -> list[dict[str, Any]]:
         api_messages: list[dict[str, Any]] = []
-        effective_system = self._apply_reasoning(system_prompt)
-        if effective_system:
-            api_messages.append({"role": "system", "content": effective_system})
-        api_messages.extend(
-            {
-                k: v
-                for k, v in {"role": m.role, "content": m.content, "name": m.name}.items()
-                if v is not None
-            }
-            for m in messages
-        )
+        if system_prompt:
+            cached = self._sys_msg_cache
+            if cached is not None and cached[0] is system_prompt:
+                api_messages.append(cached[1])
+            else:
+                sys_msg = {"role": "system", "content": self._apply_reasoning(system_prompt)}
+                self._sys_msg_cache = (system_prompt, sys_msg)
+                api_messages.append(sys_msg)
+        else:
+            effective_system = self._apply_reasoning(system_prompt)
+            if effective_system:
+                api_messages.append({"role": "system", "content": effective_system})
+        api_messages += [m.as_openai() for m in messages]
         return api_messages
 
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
         api_messages = self._build_api_messages(messages, system_prompt)
 
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": api_messages,
-            "temperature": self.temperature,
-        }
-        if self.max_tokens:
-            kwargs["max_tokens"] = self.max_tokens
-
-        response = await self.client.chat.completions.create(**kwargs)
+        response = await self.client.chat.completions.create(
+            **self._base_kwargs, messages=api_messages
+        )
         choice = response.choices[0]
         content = self.strip_thinking(choice.message.content or "")
         return Response(
@@ -105,60 +126,40 @@ class LMStudioProvider(LLMProvider):
 
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
         api_messages = self._build_api_messages(messages, system_prompt)
 
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": api_messages,
-            "temperature": self.temperature,
-            "stream": True,
-        }
-        if self.max_tokens:
-            kwargs["max_tokens"] = self.max_tokens
-
-        response = await self.client.chat.completions.create(**kwargs)
+        response = await self.client.chat.completions.create(
+            **self._base_stream_kwargs, messages=api_messages
+        )
 
-        buffer = ""
-        in_think = False
-        just_closed_think = False
+        think_filter = ThinkTagFilter()
         async for chunk in response:
             if not chunk.choices or chunk.choices[0].delta.content is None:
                 continue
             raw = chunk.choices[0].delta.content
             if not raw:
                 continue
-            buffer += raw
-            while True:
-                if in_think:
-                    end = buffer.find("</think>")
-                    if end == -1:
-                        break
-                    buffer = buffer[end + len("</think>") :]
-                    in_think = False
-                    just_closed_think = True
-                else:
-                    start = buffer.find("<think>")
-                    if start == -1:
-                        if just_closed_think:
-                            buffer = buffer.lstrip("\n")
-                            just_closed_think = False
-                        yield buffer
-                        buffer = ""
-                        break
-                    if start > 0:
-                        yield buffer[:start]
-                    buffer = buffer[start + len("<think>") :]
-                    in_think = True
-                    just_closed_think = False
-        if buffer and not in_think:
-            if just_closed_think:
-                buffer = buffer.lstrip("\n")
-            yield buffer
+            text = think_filter.feed(raw)
+            if text:
+                yield text
+        tail = think_filter.flush()
+        if tail:
+            yield tail
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.close()
-            self._client = None
+        if self._client is None:
+            return
+        key = self._client_key
+        self._client = None
+        self._client_key = None
+        refs = _CLIENT_REFS.get(key, 0) - 1
+        if refs > 0:
+            _CLIENT_REFS[key] = refs
+            return
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENT_CACHE.pop(key, None)
+        if client is not None:
+            await client.close()
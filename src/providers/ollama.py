@@ -1,11 +1,15 @@
 """Ollama provider (local)."""
 
-import json
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable
 
 import httpx
 
-from .base import LLMProvider, Message, Response
+from .base import LLMProvider, Message, Response, ThinkTagFilter, json_loads
+
+# One httpx client per base_url so several agents talking to the same Ollama
+# server share a keep-alive connection pool; refcounted close.
+_CLIENT_CACHE: dict[str, httpx.AsyncClient] = {}
+_CLIENT_REFS: dict[str, int] = {}
 
 
 class OllamaProvider(LLMProvider):
@@ -21,37 +25,52 @@ class OllamaProvider(LLMProvider):
     ):
         super().__init__(model, temperature, max_tokens, **kwargs)
         self.base_url = base_url.rstrip("/")
+        # Invariant part of the request payload, merged with the messages
+        # list on each call.
+        base: dict[str, Any] = {"model": model, "temperature": temperature}
+        if max_tokens:
+            base["options"] = {"num_predict": max_tokens}
+        self._base_payload = base | {"stream": False}
+        self._base_stream_payload = base | {"stream": True}
         self._client: httpx.AsyncClient | None = None
+        self._client_key: str | None = None
 
     @property
     def client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=520.0)
+            key = self.base_url
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                # http2 only applies when the server negotiates it (e.g. a
+                # TLS-terminated remote); plain-http local servers stay on
+                # HTTP/1.1 with keep-alive.
+                client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=httpx.Timeout(520.0, connect=5.0),
+                    headers={"Accept-Encoding": "gzip"},
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                )
+                _CLIENT_CACHE[key] = client
+            _CLIENT_REFS[key] = _CLIENT_REFS.get(key, 0) + 1
+            self._client = client
+            self._client_key = key
         return self._client
 
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
-        payload: dict[str, Any] = {
-            "model": self.model,
-            "messages": [],
-            "temperature": self.temperature,
-            "stream": False,
-        }
-        if system_prompt:
-            payload["messages"].append({"role": "system", "content": system_prompt})
-        payload["messages"].extend([{"role": m.role, "content": m.content} for m in messages])
-        if self.max_tokens:
-            payload["options"] = {"num_predict": self.max_tokens}
+        msgs = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        msgs += [{"role": m.role, "content": m.content} for m in messages]
+        payload = self._base_payload | {"messages": msgs}
 
         response = await self.client.post(
             f"{self.base_url}/api/chat",
             json=payload,
         )
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
 
         return Response(
             content=self.strip_thinking(data["message"]["content"]),
@@ -61,21 +80,13 @@ class OllamaProvider(LLMProvider):
 
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
         """Streaming version of chat."""
-        payload: dict[str, Any] = {
-            "model": self.model,
-            "messages": [],
-            "temperature": self.temperature,
-            "stream": True,
-        }
-        if system_prompt:
-            payload["messages"].append({"role": "system", "content": system_prompt})
-        payload["messages"].extend([{"role": m.role, "content": m.content} for m in messages])
-        if self.max_tokens:
-            payload["options"] = {"num_predict": self.max_tokens}
+        msgs = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        msgs += [{"role": m.role, "content": m.content} for m in messages]
+        payload = self._base_stream_payload | {"messages": msgs}
 
         async with self.client.stream(
             "POST",
@@ -83,48 +94,44 @@ class OllamaProvider(LLMProvider):
             json=payload,
         ) as response:
             response.raise_for_status()
-            buffer = ""
-            in_think = False
-            just_closed_think = False
-            async for line in response.aiter_lines():
-                if line.strip():
+            think_filter = ThinkTagFilter()
+            # Split the NDJSON stream at the byte level and feed raw line
+            # bytes straight to the JSON decoder, skipping the extra string
+            # buffer and utf-8 pass aiter_lines would maintain.
+            buf = bytearray()
+            async for raw in response.aiter_bytes():
+                buf += raw
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl])
+                    del buf[: nl + 1]
+                    if not line.strip():
+                        continue
                     try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
+                        data = json_loads(line)
+                    except ValueError:
                         continue
                     if "message" in data and "content" in data["message"]:
                         chunk = data["message"]["content"]
                         if not chunk:
                             continue
-                        buffer += chunk
-                        while True:
-                            if in_think:
-                                end = buffer.find("</think>")
-                                if end == -1:
-                                    break
-                                buffer = buffer[end + len("</think>") :]
-                                in_think = False
-                                just_closed_think = True
-                            else:
-                                start = buffer.find("<think>")
-                                if start == -1:
-                                    if just_closed_think:
-                                        buffer = buffer.lstrip("\n")
-                                        just_closed_think = False
-                                    yield buffer
-                                    buffer = ""
-                                    break
-                                if start > 0:
-                                    yield buffer[:start]
-                                buffer = buffer[start + len("<think>") :]
-                                in_think = True
-                                just_closed_think = False
-            if buffer and not in_think:
-                if just_closed_think:
-                    buffer = buffer.lstrip("\n")
-                yield buffer
+                        text = think_filter.feed(chunk)
+                        if text:
+                            yield text
+            tail = think_filter.flush()
+            if tail:
+                yield tail
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        if self._client is None:
+            return
+        key = self._client_key
+        self._client = None
+        self._client_key = None
+        refs = _CLIENT_REFS.get(key, 0) - 1
+        if refs > 0:
+            _CLIENT_REFS[key] = refs
+            return
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENT_CACHE.pop(key, None)
+        if client is not None:
+            await client.aclose()
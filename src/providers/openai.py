@@ -1,12 +1,18 @@
 """OpenAI provider."""
 
 import os
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Iterable
 
 from openai import AsyncOpenAI
 
 from .base import LLMProvider, Message, Response
 
+# One AsyncOpenAI client (one connection pool) per (api_key, base_url) pair,
+# shared by every provider instance targeting the same endpoint. Refcounted
+# so close() tears the client down only when the last user releases it.
+_CLIENT_CACHE: dict[tuple[str | None, str | None], AsyncOpenAI] = {}
+_CLIENT_REFS: dict[tuple[str | None, str | None], int] = {}
+
 
 class OpenAIProvider(LLMProvider):
     """Provider for OpenAI API."""
@@ -23,39 +29,43 @@ class OpenAIProvider(LLMProvider):
         super().__init__(model, temperature, max_tokens, **kwargs)
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.base_url = base_url
+        # Per-call kwargs never vary except for the messages list, so the
+        # invariant part is built once and merged per request.
+        base: dict[str, Any] = {"model": model, "temperature": temperature}
+        if max_tokens:
+            base["max_tokens"] = max_tokens
+        self._base_kwargs = base
+        self._base_stream_kwargs = base | {"stream": True}
         self._client: AsyncOpenAI | None = None
+        self._client_key: tuple[str | None, str | None] | None = None
 
     @property
     def client(self) -> AsyncOpenAI:
         if self._client is None:
-            self._client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.base_url,
-            )
+            key = (self.api_key, self.base_url)
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = AsyncOpenAI(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                )
+                _CLIENT_CACHE[key] = client
+            _CLIENT_REFS[key] = _CLIENT_REFS.get(key, 0) + 1
+            self._client = client
+            self._client_key = key
         return self._client
 
     async def chat(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> Response:
-        api_messages = []
-        if system_prompt:
-            api_messages.append({"role": "system", "content": system_prompt})
-        api_messages.extend([
-            {"role": m.role, "content": m.content, "name": m.name}
-            for m in messages
-        ])
-
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": api_messages,
-            "temperature": self.temperature,
-        }
-        if self.max_tokens:
-            kwargs["max_tokens"] = self.max_tokens
+        api_messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        api_messages += [m.as_openai() for m in messages]
 
-        response = await self.client.chat.completions.create(**kwargs)
+        response = await self.client.chat.completions.create(
+            **self._base_kwargs, messages=api_messages
+        )
         choice = response.choices[0]
         return Response(
             content=choice.message.content or "",
@@ -70,32 +80,30 @@ class OpenAIProvider(LLMProvider):
 
     async def chat_stream(
         self,
-        messages: list[Message],
+        messages: Iterable[Message],
         system_prompt: str | None = None,
     ) -> "AsyncGenerator[str, None]":
-        api_messages = []
-        if system_prompt:
-            api_messages.append({"role": "system", "content": system_prompt})
-        api_messages.extend([
-            {"role": m.role, "content": m.content, "name": m.name}
-            for m in messages
-        ])
+        api_messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        api_messages += [m.as_openai() for m in messages]
 
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": api_messages,
-            "temperature": self.temperature,
-            "stream": True,
-        }
-        if self.max_tokens:
-            kwargs["max_tokens"] = self.max_tokens
-
-        response = await self.client.chat.completions.create(**kwargs)
+        response = await self.client.chat.completions.create(
+            **self._base_stream_kwargs, messages=api_messages
+        )
         async for chunk in response:
             if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.close()
-            self._client = None
+        if self._client is None:
+            return
+        key = self._client_key
+        self._client = None
+        self._client_key = None
+        refs = _CLIENT_REFS.get(key, 0) - 1
+        if refs > 0:
+            _CLIENT_REFS[key] = refs
+            return
+        _CLIENT_REFS.pop(key, None)
+        client = _CLIENT_CACHE.pop(key, None)
+        if client is not None:
+            await client.close()
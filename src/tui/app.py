@@ -1,6 +1,9 @@
 """TUI interface for agents-meeting."""
 
+import asyncio
+import re
 import time
+from collections import deque
 from datetime import datetime
 from textual.app import App, ComposeResult, ScreenStackError
 from textual.containers import Vertical, ScrollableContainer, Horizontal, Center, Middle
@@ -14,6 +17,15 @@ from textual.reactive import reactive
 from src.agents import DebateManager, DebateEvent
 from src.config import MeetingConfig
 
+# Widget ids may only contain ASCII letters, digits, '-' and '_'; everything
+# else in an agent name is replaced in one C-level pass.
+_SAFE_ID_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def _safe_id(name: str) -> str:
+    """Sanitize an agent name into a valid widget id fragment."""
+    return _SAFE_ID_RE.sub("_", name)
+
 
 # ---------------------------------------------------------------------------
 # Round picker widget
@@ -55,24 +67,26 @@ class RoundPicker(Widget):
 
     def __init__(self, initial: int = 2, **kwargs):
         super().__init__(**kwargs)
+        self._buttons: list[Static] = []
         self.value = initial
 
     def compose(self) -> ComposeResult:
+        self._buttons.clear()
         for n in range(1, 11):
             classes = "round-btn round-btn--active" if n == self.value else "round-btn"
-            yield Static(str(n), id=f"round-{n}", classes=classes)
+            btn = Static(str(n), id=f"round-{n}", classes=classes)
+            self._buttons.append(btn)
+            yield btn
 
     def watch_value(self, new_value: int) -> None:
         """Update CSS classes when value changes."""
-        for n in range(1, 11):
-            try:
-                btn = self.query_one(f"#round-{n}", Static)
-                if n == new_value:
-                    btn.add_class("round-btn--active")
-                else:
-                    btn.remove_class("round-btn--active")
-            except Exception:
-                pass
+        # Buttons are kept from compose, so no selector queries here; before
+        # compose runs (initial value assignment) the list is simply empty.
+        for n, btn in enumerate(self._buttons, start=1):
+            if n == new_value:
+                btn.add_class("round-btn--active")
+            else:
+                btn.remove_class("round-btn--active")
 
     def on_click(self, event) -> None:
         """Detect click on a number."""
@@ -242,64 +256,103 @@ class AgentCard(Widget):
         self.agent_model = agent_model
         self.is_leader = is_leader
         self._phase = ""
-        self._current_content = ""
-        self._dirty = False
-        safe = "".join(c if c.isascii() and (c.isalnum() or c in "-_") else "_" for c in agent_name)
+        # Streamed chunks are buffered in a list and joined once per flush;
+        # appending to a shared str would recopy the whole buffer per token.
+        self._chunks: list[str] = []
+        self._joined_cache = ""
+        # Monotonic content version vs. last version pushed to the widget;
+        # the tick only re-renders when they differ.
+        self._version = 0
+        self._last_flushed_version = -1
+        safe = _safe_id(agent_name)
         self._header_id = f"hdr_{safe}"
         self._body_id = f"bdy_{safe}"
         self._history_id = f"hist_{safe}"
         self._streaming_id = f"strm_{safe}"
-        self._history_dirty = False
-        self._history_content = ""
-        self._streaming_content = ""
-        self._streaming_dirty = False
+        self._last_streaming_version = -1
+        # Child widget handles, resolved once in on_mount so the per-tick
+        # flush paths never run a selector query.
+        self._body_widget: Markdown | None = None
+        self._history_widget: Vertical | None = None
+        self._streaming_widget: Markdown | None = None
 
     def compose(self) -> ComposeResult:
         role_line = f"\n[dim]{self.agent_role}[/dim]" if self.agent_role else ""
         model_line = f"\n[dim italic]{self.agent_model}[/dim italic]" if self.agent_model else ""
         yield Static(f"[bold]{self.agent_name}[/bold]{role_line}{model_line}", id=self._header_id)
         if self.is_leader:
-            yield Markdown("", id=self._history_id)
+            # Finalized sections are mounted as immutable Markdown children;
+            # only the streaming tail below is ever re-rendered.
+            yield Vertical(id=self._history_id)
             yield Markdown("", id=self._streaming_id)
         else:
             yield Markdown("", id=self._body_id)
 
-    def _body(self) -> Markdown:
-        return self.query_one(f"#{self._body_id}", Markdown)
+    def on_mount(self) -> None:
+        if self.is_leader:
+            self._history_widget = self.query_one(f"#{self._history_id}", Vertical)
+            self._streaming_widget = self.query_one(f"#{self._streaming_id}", Markdown)
+        else:
+            self._body_widget = self.query_one(f"#{self._body_id}", Markdown)
 
     def flush_render(self) -> None:
-        if self._dirty:
-            self._body().update(self._current_content)
-            self._dirty = False
+        if self._version != self._last_flushed_version and self._body_widget is not None:
+            if self._chunks:
+                # Collapse so the next flush only re-joins new chunks.
+                if len(self._chunks) > 1:
+                    self._chunks[:] = ["".join(self._chunks)]
+                self._joined_cache = self._chunks[0]
+            else:
+                self._joined_cache = ""
+            self._body_widget.update(self._joined_cache)
+            self._last_flushed_version = self._version
+
+    def flush_leader_render(self, streaming: str, streaming_version: int) -> None:
+        if self._streaming_widget is None:
+            return
+        if streaming_version != self._last_streaming_version:
+            self._last_streaming_version = streaming_version
+            self._streaming_widget.update(streaming)
+
+    def append_history_section(self, content: str) -> None:
+        """Mount a finalized leader section; it is never re-parsed afterwards."""
+        if self._history_widget is not None:
+            self._history_widget.mount(Markdown(content))
 
-    def flush_leader_render(self, history: str, history_dirty: bool, streaming: str) -> None:
-        if history_dirty:
-            self.query_one(f"#{self._history_id}", Markdown).update(history)
-        if streaming != self._streaming_content:
-            self._streaming_content = streaming
-            self.query_one(f"#{self._streaming_id}", Markdown).update(streaming)
+    def clear_history(self) -> None:
+        if self._history_widget is not None:
+            self._history_widget.remove_children()
 
     def reset(self) -> None:
-        self._current_content = ""
+        self._chunks.clear()
+        self._joined_cache = ""
         self._phase = ""
-        self._dirty = False
-        self._body().update("")
+        self._version += 1
+        self._last_flushed_version = self._version
+        if self._body_widget is not None:
+            self._body_widget.update("")
 
     def set_thinking(self, phase: str) -> None:
         self._phase = phase
-        self._current_content = ""
-        self._dirty = False
-        self._body().update("*Thinking...*")
+        self._chunks.clear()
+        self._joined_cache = ""
+        self._version += 1
+        self._last_flushed_version = self._version
+        if self._body_widget is not None:
+            self._body_widget.update("*Thinking...*")
 
     def set_content(self, phase: str, content: str) -> None:
         self._phase = phase
-        self._current_content = content
-        self._dirty = False
-        self._body().update(content)
+        self._chunks[:] = [content]
+        self._joined_cache = content
+        self._version += 1
+        self._last_flushed_version = self._version
+        if self._body_widget is not None:
+            self._body_widget.update(content)
 
     def append_chunk(self, chunk: str) -> None:
-        self._current_content += chunk
-        self._dirty = True
+        self._chunks.append(chunk)
+        self._version += 1
 
 
 # ---------------------------------------------------------------------------
@@ -403,7 +456,13 @@ class FilenameScreen(Screen):
 
 
 class DebateEventMessage(Message):
-    """Textual message transporting a DebateEvent."""
+    """Textual message transporting a DebateEvent.
+
+    One of these is allocated per (already coalesced) stream chunk, so the
+    payload lives in a slot rather than growing the instance dict.
+    """
+
+    __slots__ = ("debate_event",)
 
     def __init__(self, event: DebateEvent):
         super().__init__()
@@ -540,6 +599,11 @@ class DebateScreen(Screen):
         Binding("plus", "add_round", "+1 Round", show=True),
     ]
 
+    # Back-pressure bound for the debate event queue: past this size, new
+    # streaming chunks are merged into the last queued chunk of the same
+    # agent instead of growing the backlog further.
+    _EVENT_QUEUE_MAX = 256
+
     CSS = """
     DebateScreen {
         background: $surface;
@@ -593,6 +657,10 @@ class DebateScreen(Screen):
         overflow-y: hidden;
     }
 
+    AgentCard Vertical {
+        height: auto;
+    }
+
     #leader_scroll {
         height: 20;
         border: solid $accent;
@@ -619,22 +687,53 @@ class DebateScreen(Screen):
         self.config = config
         self.debate_manager: DebateManager | None = None
         self.agent_cards: dict[str, AgentCard] = {}
-        self.leader_name: str | None = None
+        # Card plan: (agent_config, widget id, model string) per column plus
+        # the leader, computed once here so compose is a flat loop with no
+        # repeated filtering or string building.
+        non_leaders = [a for a in config.agents if not a.is_leader]
+        self._left_plan = [
+            (a, "card_" + _safe_id(a.name), f"{a.provider} / {a.model}") for a in non_leaders[0::2]
+        ]
+        self._right_plan = [
+            (a, "card_" + _safe_id(a.name), f"{a.provider} / {a.model}") for a in non_leaders[1::2]
+        ]
+        leader = next((a for a in config.agents if a.is_leader), None)
+        self._leader_plan = (
+            (leader, "card_" + _safe_id(leader.name), f"{leader.provider} / {leader.model}")
+            if leader is not None
+            else None
+        )
+        self.leader_name: str | None = leader.name if leader is not None else None
         self._current_round = 0
         self._total_rounds = config.debate.rounds
-        self._leader_history: str = ""
+        self._leader_has_history: bool = False
         self._leader_streaming: str = ""
-        self._leader_history_dirty: bool = False
-        self._leader_flush_interval = None
+        self._leader_streaming_version: int = 0
+        self._leader_dirty: bool = False
+        self._dirty_cards: set[str] = set()
+        self._clock_interval = None
+        self._content_interval = None
         self._agent_container: dict[str, str] = {}
         self._scroll_pending: set[str] = set()
-        self._user_scrolled_up: set[str] = set()
+        # Whether each container is pinned to the bottom; auto-scroll only
+        # fires for pinned containers, so a user who scrolled up is left
+        # alone and no refresh work is queued for them.
+        self._pinned: dict[str, bool] = {}
         # Stopwatch
         self._start_time: float | None = None
         self._debate_ended: bool = False
         self._current_phase_display: str = ""
         self._continuation_question: str = ""
         self._continue_screen: ContinueScreen | None = None
+        # Widget handles resolved once in on_mount; the 100 ms flush tick
+        # and the event handler run constantly, so they must not pay for a
+        # selector walk each time.
+        self._status_label: Label | None = None
+        self._containers: dict[str, ScrollableContainer] = {}
+        # Debate events are queued here and forwarded to the message pump in
+        # coalesced batches by _pump_events.
+        self._event_queue: deque[DebateEvent] = deque()
+        self._event_wakeup = asyncio.Event()
 
     def compose(self) -> ComposeResult:
         yield Label(
@@ -647,18 +746,9 @@ class DebateScreen(Screen):
         )
         yield Label("", id="continue-hint")
 
-        non_leaders = [a for a in self.config.agents if not a.is_leader]
-        left_agents = non_leaders[0::2]
-        right_agents = non_leaders[1::2]
-
         with Horizontal(id="agents_columns"):
             with ScrollableContainer(id="agents_col_left"):
-                for agent_config in left_agents:
-                    safe_id = "card_" + "".join(
-                        c if c.isascii() and (c.isalnum() or c in "-_") else "_"
-                        for c in agent_config.name
-                    )
-                    model_str = f"{agent_config.provider} / {agent_config.model}"
+                for agent_config, safe_id, model_str in self._left_plan:
                     card = AgentCard(
                         agent_config.name, agent_config.role or "", model_str, id=safe_id
                     )
@@ -667,12 +757,7 @@ class DebateScreen(Screen):
                     yield card
 
             with ScrollableContainer(id="agents_col_right"):
-                for agent_config in right_agents:
-                    safe_id = "card_" + "".join(
-                        c if c.isascii() and (c.isalnum() or c in "-_") else "_"
-                        for c in agent_config.name
-                    )
-                    model_str = f"{agent_config.provider} / {agent_config.model}"
+                for agent_config, safe_id, model_str in self._right_plan:
                     card = AgentCard(
                         agent_config.name, agent_config.role or "", model_str, id=safe_id
                     )
@@ -681,23 +766,17 @@ class DebateScreen(Screen):
                     yield card
 
         with ScrollableContainer(id="leader_scroll"):
-            for agent_config in self.config.agents:
-                if agent_config.is_leader:
-                    self.leader_name = agent_config.name
-                    safe_id = "card_" + "".join(
-                        c if c.isascii() and (c.isalnum() or c in "-_") else "_"
-                        for c in agent_config.name
-                    )
-                    model_str = f"{agent_config.provider} / {agent_config.model}"
-                    leader_card = AgentCard(
-                        agent_config.name,
-                        agent_config.role or "",
-                        model_str,
-                        is_leader=True,
-                        id=safe_id,
-                    )
-                    self.agent_cards[agent_config.name] = leader_card
-                    yield leader_card
+            if self._leader_plan is not None:
+                agent_config, safe_id, model_str = self._leader_plan
+                leader_card = AgentCard(
+                    agent_config.name,
+                    agent_config.role or "",
+                    model_str,
+                    is_leader=True,
+                    id=safe_id,
+                )
+                self.agent_cards[agent_config.name] = leader_card
+                yield leader_card
 
         with Horizontal(id="status_bar"):
             yield Label("[yellow]Initializing...[/yellow]", id="status")
@@ -705,7 +784,16 @@ class DebateScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        self._leader_flush_interval = self.set_interval(0.1, self._flush_tick)
+        self._status_label = self.query_one("#status", Label)
+        self._containers = {
+            cid: self.query_one(cid, ScrollableContainer)
+            for cid in ("#agents_col_left", "#agents_col_right", "#leader_scroll")
+        }
+        # The stopwatch only needs 1 Hz; content flushes run on their own
+        # faster timer and bail out immediately when nothing changed.
+        self._clock_interval = self.set_interval(1.0, self._tick_clock)
+        self._content_interval = self.set_interval(0.05, self._tick_content)
+        self._pump_events()
         self.start_debate()
 
     async def on_unmount(self) -> None:
@@ -716,23 +804,31 @@ class DebateScreen(Screen):
             except Exception:
                 pass
 
-    def on_mouse_scroll_up(self) -> None:
-        self._update_scroll_flags()
-
-    def on_mouse_scroll_down(self) -> None:
+    def on_mouse_scroll_up(self, event) -> None:
+        self._update_scroll_flag_for(event)
+
+    def on_mouse_scroll_down(self, event) -> None:
+        self._update_scroll_flag_for(event)
+
+    def _update_scroll_flag_for(self, event) -> None:
+        """Re-evaluate the pinned flag for the container the wheel acted on.
+
+        The event already identifies its target, so only that container's
+        position is checked instead of walking all three on every wheel tick.
+        """
+        node = getattr(event, "control", None) or getattr(event, "widget", None)
+        while node is not None:
+            if isinstance(node, ScrollableContainer) and node.id:
+                cid = f"#{node.id}"
+                if cid in self._containers:
+                    self._pinned[cid] = node.scroll_y >= node.max_scroll_y - 1
+                    return
+            node = getattr(node, "parent", None)
         self._update_scroll_flags()
 
     def _update_scroll_flags(self) -> None:
-        container_ids = ["#agents_col_left", "#agents_col_right", "#leader_scroll"]
-        for cid in container_ids:
-            try:
-                container = self.query_one(cid, ScrollableContainer)
-                if container.scroll_y < container.max_scroll_y - 3:
-                    self._user_scrolled_up.add(cid)
-                else:
-                    self._user_scrolled_up.discard(cid)
-            except Exception:
-                pass
+        for cid, container in self._containers.items():
+            self._pinned[cid] = container.scroll_y >= container.max_scroll_y - 1
 
     def _elapsed_str(self) -> str:
         if self._start_time is None:
@@ -741,45 +837,45 @@ class DebateScreen(Screen):
         minutes, seconds = divmod(elapsed, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
-    def _flush_tick(self) -> None:
+    def _tick_clock(self) -> None:
         # Update the stopwatch in the status bar if debate is in progress
+        if self._status_label is None:
+            return
         if self._start_time is not None and not self._debate_ended:
-            try:
-                status = self.query_one("#status", Label)
-                elapsed = self._elapsed_str()
-                round_info = (
-                    f"Round {self._current_round}/{self._total_rounds}"
-                    if self._current_round > 0
-                    else "Intro"
-                )
-                phase_display = self._current_phase_display
-                status.update(f"[cyan]{round_info} · {phase_display} · {elapsed}[/cyan]")
-            except Exception:
-                pass
+            elapsed = self._elapsed_str()
+            round_info = (
+                f"Round {self._current_round}/{self._total_rounds}"
+                if self._current_round > 0
+                else "Intro"
+            )
+            phase_display = self._current_phase_display
+            self._status_label.update(f"[cyan]{round_info} · {phase_display} · {elapsed}[/cyan]")
 
-        # Flush non-leader agents
-        for name, card in self.agent_cards.items():
-            if name != self.leader_name:
+    def _tick_content(self) -> None:
+        if not self._dirty_cards and not self._leader_dirty and not self._scroll_pending:
+            return
+
+        # Flush only the agents that received content since the last tick
+        for name in self._dirty_cards:
+            card = self.agent_cards.get(name)
+            if card is not None:
                 card.flush_render()
+        self._dirty_cards.clear()
 
         # Flush leader
-        if self.leader_name and self.leader_name in self.agent_cards:
-            leader_card = self.agent_cards[self.leader_name]
-            leader_card.flush_leader_render(
-                history=self._leader_history,
-                history_dirty=self._leader_history_dirty,
+        if self._leader_dirty and self.leader_name and self.leader_name in self.agent_cards:
+            self.agent_cards[self.leader_name].flush_leader_render(
                 streaming=self._leader_streaming,
+                streaming_version=self._leader_streaming_version,
             )
-            self._leader_history_dirty = False
+            self._leader_dirty = False
 
         # Flush scrolls
-        for container_id in list(self._scroll_pending):
-            if container_id not in self._user_scrolled_up:
-                try:
-                    container = self.query_one(container_id, ScrollableContainer)
-                    container.call_after_refresh(container.scroll_end, animate=False)
-                except Exception:
-                    pass
+        for container_id in self._scroll_pending:
+            if self._pinned.get(container_id, True):
+                container = self._containers.get(container_id)
+                if container is not None:
+                    container.scroll_end(animate=False)
         self._scroll_pending.clear()
 
     def _scroll_to_bottom(self, agent_name: str | None) -> None:
@@ -787,14 +883,18 @@ class DebateScreen(Screen):
             container_id = "#leader_scroll"
         else:
             container_id = self._agent_container.get(agent_name or "", "#agents_col_left")
-        self._scroll_pending.add(container_id)
+        if self._pinned.get(container_id, True):
+            self._scroll_pending.add(container_id)
 
     def _update_leader_display(self) -> None:
+        self._leader_dirty = True
         self._scroll_to_bottom(self.leader_name)
 
     def on_debate_event_message(self, message: DebateEventMessage) -> None:
         event = message.debate_event
-        status = self.query_one("#status", Label)
+        status = self._status_label
+        if status is None:
+            return
 
         if event.type == "phase_start":
             self._current_round = event.round
@@ -806,31 +906,41 @@ class DebateScreen(Screen):
                         card.reset()
 
         elif event.type == "leader_section_start":
+            leader_card = self.agent_cards.get(self.leader_name or "")
             if self._leader_streaming and self._leader_streaming != "*Thinking...*":
-                self._leader_history += self._leader_streaming
+                if leader_card is not None:
+                    leader_card.append_history_section(self._leader_streaming)
+                self._leader_has_history = True
             self._leader_streaming = ""
+            self._leader_streaming_version += 1
             header = event.content or ""
-            if self._leader_history:
-                self._leader_history += f"\n\n---\n\n{header}\n\n"
-            else:
-                self._leader_history = f"{header}\n\n"
-            self._leader_history_dirty = True
+            section = f"\n\n---\n\n{header}\n\n" if self._leader_has_history else f"{header}\n\n"
+            if leader_card is not None:
+                leader_card.append_history_section(section)
+            self._leader_has_history = True
             self._update_leader_display()
 
         elif event.type == "leader_thinking":
             self._leader_streaming = "*Thinking...*"
+            self._leader_streaming_version += 1
             self._update_leader_display()
 
         elif event.type == "leader_streaming":
             if self._leader_streaming == "*Thinking...*":
                 self._leader_streaming = ""
             self._leader_streaming += event.content or ""
+            self._leader_streaming_version += 1
             self._update_leader_display()
 
         elif event.type == "leader_speak":
-            self._leader_history += event.content or ""
+            content = event.content or ""
+            if content:
+                leader_card = self.agent_cards.get(self.leader_name or "")
+                if leader_card is not None:
+                    leader_card.append_history_section(content)
+                self._leader_has_history = True
             self._leader_streaming = ""
-            self._leader_history_dirty = True
+            self._leader_streaming_version += 1
             self._update_leader_display()
 
         elif event.type == "agent_thinking":
@@ -841,6 +951,7 @@ class DebateScreen(Screen):
         elif event.type == "agent_streaming":
             if event.agent_name and event.agent_name in self.agent_cards:
                 self.agent_cards[event.agent_name].append_chunk(event.content or "")
+                self._dirty_cards.add(event.agent_name)
                 self._scroll_to_bottom(event.agent_name)
 
         elif event.type == "agent_speak":
@@ -886,7 +997,8 @@ class DebateScreen(Screen):
 
     def save_debate(self) -> None:
         if self.debate_manager is None:
-            self.query_one("#status", Label).update("[red]No debate in progress.[/red]")
+            if self._status_label is not None:
+                self._status_label.update("[red]No debate in progress.[/red]")
             return
         default = datetime.now().strftime("debate_%Y-%m-%d_%H-%M.md")
         self.app.push_screen(FilenameScreen(default_name=default), self._on_filename_chosen)
@@ -897,15 +1009,21 @@ class DebateScreen(Screen):
         self._do_save(filename)
 
     def _do_save(self, path: str) -> None:
+        self.run_worker(self._save_worker(path), exclusive=False)
+
+    async def _save_worker(self, path: str) -> None:
         try:
-            saved = self.debate_manager.save(path)  # type: ignore[union-attr]
-            self.query_one("#status", Label).update(f"[green]Saved: {saved}[/green]")
+            saved = await self.debate_manager.save(path)  # type: ignore[union-attr]
+            if self._status_label is not None:
+                self._status_label.update(f"[green]Saved: {saved}[/green]")
         except Exception as e:
-            self.query_one("#status", Label).update(f"[red]Save error: {e}[/red]")
+            if self._status_label is not None:
+                self._status_label.update(f"[red]Save error: {e}[/red]")
 
     def action_toggle_leader(self) -> None:
-        leader_scroll = self.query_one("#leader_scroll")
-        leader_scroll.display = not leader_scroll.display
+        leader_scroll = self._containers.get("#leader_scroll")
+        if leader_scroll is not None:
+            leader_scroll.display = not leader_scroll.display
 
     def check_action(self, action: str, parameters: tuple) -> bool | None:
         """Disable 'continue_debate' and 'add_round' actions until the debate is finished."""
@@ -965,9 +1083,10 @@ class DebateScreen(Screen):
         self._debate_ended = False
         self._continuation_question = ""
         self._continue_screen = None
-        self._leader_history = ""
+        self._leader_has_history = False
         self._leader_streaming = ""
-        self._leader_history_dirty = False
+        self._leader_streaming_version += 1
+        self._leader_dirty = True
         self._current_round = 0
         self._start_time = None
 
@@ -983,9 +1102,11 @@ class DebateScreen(Screen):
         except Exception:
             pass
 
-        # Reset non-leader agent cards
+        # Reset agent cards and drop the leader's mounted history sections
         for name, card in self.agent_cards.items():
-            if name != self.leader_name:
+            if name == self.leader_name:
+                card.clear_history()
+            else:
                 card.reset()
 
         # Refresh bindings
@@ -1002,15 +1123,59 @@ class DebateScreen(Screen):
         if self.debate_manager is None:
             return
         self.debate_manager.cancel()
-        status = self.query_one("#status", Label)
-        status.update("[yellow]Stopping...[/yellow]")
+        if self._status_label is not None:
+            self._status_label.update("[yellow]Stopping...[/yellow]")
+
+    def _enqueue_event(self, event: DebateEvent) -> None:
+        """Queue a debate event for the pump, merging chunks under pressure."""
+        queue = self._event_queue
+        if (
+            queue
+            and len(queue) >= self._EVENT_QUEUE_MAX
+            and event.type in ("agent_streaming", "leader_streaming")
+        ):
+            last = queue[-1]
+            if last.type == event.type and last.agent_name == event.agent_name:
+                last.content = (last.content or "") + (event.content or "")
+                self._event_wakeup.set()
+                return
+        queue.append(event)
+        self._event_wakeup.set()
+
+    @work(exclusive=True, group="event_pump")
+    async def _pump_events(self) -> None:
+        """Forward queued debate events to the message pump in batches.
+
+        Streams can produce events faster than the UI consumes them. The
+        pump drains the queue at most every 20 ms and merges consecutive
+        streaming chunks from the same agent into a single message, so a
+        flood of tokens costs one queue pop and one Markdown flush instead
+        of one per token. The worker is cancelled with the screen.
+        """
+        queue = self._event_queue
+        while True:
+            await self._event_wakeup.wait()
+            self._event_wakeup.clear()
+            while queue:
+                event = queue.popleft()
+                if event.type in ("agent_streaming", "leader_streaming"):
+                    parts = [event.content or ""]
+                    while (
+                        queue
+                        and queue[0].type == event.type
+                        and queue[0].agent_name == event.agent_name
+                    ):
+                        parts.append(queue.popleft().content or "")
+                    if len(parts) > 1:
+                        event.content = "".join(parts)
+                self.post_message(DebateEventMessage(event))
+            await asyncio.sleep(0.02)
 
     @work(exclusive=True, thread=False)
     async def start_debate(self) -> None:
         self._start_time = time.monotonic()
 
-        def on_event(event: DebateEvent) -> None:
-            self.post_message(DebateEventMessage(event))
+        on_event = self._enqueue_event
 
         # If a manager already exists (continuation), reuse it
         if self.debate_manager is None:
@@ -1029,7 +1194,8 @@ class DebateScreen(Screen):
         finally:
             if self.debate_manager.is_cancelled:
                 try:
-                    self.query_one("#status", Label).update("[yellow]Debate stopped.[/yellow]")
+                    if self._status_label is not None:
+                        self._status_label.update("[yellow]Debate stopped.[/yellow]")
                     self._debate_ended = True
                     self.app.refresh_bindings()
                 except Exception: